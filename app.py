@@ -1,12 +1,45 @@
 from difflib import SequenceMatcher
 import re
 import os
-from flask import Flask, render_template, request, redirect 
-from pydub import AudioSegment
-import speech_recognition as sr
-from googletrans import Translator  # Importamos el traductor
+import json
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from flask import Flask, Request, render_template, request, redirect, jsonify, abort, Response, g, current_app
+from synonyms import load_synonym_index, clean_text
+from punctuation import add_question_marks
+from audio_probe import (load_audio, sniff_format, validate_wav, ffmpeg_available, AUDIO_EXTENSIONS,
+                         NATIVE_FORMATS, SNIFF_BYTES, UnsupportedAudioError)
+from speech_rate import analyze_audio_data, speaking_seconds
+from jobs import JobQueue, QueueFullError, QUEUED, RUNNING, DONE, ERROR
+from translation import TranslationCache, TranslatorPool, CachedTranslator
+from resilience import Backend, BackendUnavailableError, BackendTimeoutError
+from storage import UploadStore, UploadTooLargeError
+from transcription import transcribe_chunked
+import batch
+from diff_engine import diff_words, DELETE, SUBSTITUTE
+import metrics
+from metrics import span
+
+class AppRequest(Request):
+    # /batch recibe un zip con muchas grabaciones: tiene su propio tamaño máximo
+    @property
+    def max_content_length(self):
+        if self.url_rule is not None and self.url_rule.endpoint == 'batch_upload':
+            return current_app.config['BATCH_MAX_BYTES']
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # El audio de /upload se escribe directamente en el almacén mientras
+        # llega, calculando su hash: guardarlo no vuelve a copiar el cuerpo
+        if self.url_rule is not None and self.url_rule.endpoint == 'upload_file':
+            return get_upload_store().open_upload()
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
 
 app = Flask(__name__)
+app.request_class = AppRequest
 
 # Carpeta para almacenar los archivos subidos
 UPLOAD_FOLDER = 'uploads'
@@ -15,69 +48,308 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 # Asegúrate de que la carpeta exista
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Límites del almacén de subidas: tamaño máximo por archivo (Flask rechaza el cuerpo
+# con 413 antes de leerlo), antigüedad máxima y presupuesto total de disco
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('UPLOAD_MAX_BYTES', str(50 * 1024 * 1024)))
+app.config['UPLOAD_MAX_AGE'] = int(os.environ.get('UPLOAD_MAX_AGE', str(7 * 24 * 3600)))
+app.config['UPLOAD_MAX_TOTAL_BYTES'] = int(os.environ.get('UPLOAD_MAX_TOTAL_BYTES', str(1024 * 1024 * 1024)))
+
+# speech_recognition y googletrans tardan en importarse; se cargan en la primera
+# petición que los necesita y no en cada arranque de un worker
+def _default_recognizer():
+    import speech_recognition as sr
+    recognizer = sr.Recognizer()
+    # Que la propia conexión no espere más que la capa de resiliencia
+    recognizer.operation_timeout = app.config['RECOGNIZER_TIMEOUT']
+    return recognizer
+
+def _default_translator():
+    import httpx
+    from googletrans import Translator  # Importamos el traductor
+    # googletrans pasa el tiempo máximo tal cual a httpx, que espera un httpx.Timeout
+    return Translator(timeout=httpx.Timeout(app.config['TRANSLATOR_TIMEOUT']))
+
+# Backends de reconocimiento y traducción (se pueden sustituir por versiones locales en pruebas)
+app.config['RECOGNIZER_FACTORY'] = _default_recognizer
+app.config['TRANSLATOR_FACTORY'] = _default_translator
+
+# Diccionario de sinónimos (JSON). SYNONYMS_CACHE_PATH guarda con pickle el índice
+# ya construido para que los demás workers lo carguen sin reconstruirlo. Está
+# desactivado por defecto: cada despliegue lo activa con una ruta absoluta en un
+# directorio propio de la aplicación (p. ej. su carpeta instance/), porque quien
+# pueda escribir ese archivo ejecuta código al arrancar los workers
+app.config['SYNONYMS_PATH'] = os.environ.get('SYNONYMS_PATH', os.path.join(app.root_path, 'data', 'synonyms.json'))
+app.config['SYNONYMS_CACHE_PATH'] = os.environ.get('SYNONYMS_CACHE_PATH', '')
+
+# Transcripción por fragmentos para grabaciones largas (modo "silence" o "fixed")
+app.config['CHUNKED_TRANSCRIPTION'] = os.environ.get('CHUNKED_TRANSCRIPTION') == '1'
+app.config['CHUNK_SECONDS'] = float(os.environ.get('CHUNK_SECONDS', '30'))
+app.config['CHUNK_OVERLAP_SECONDS'] = float(os.environ.get('CHUNK_OVERLAP_SECONDS', '0'))
+app.config['CHUNK_MODE'] = os.environ.get('CHUNK_MODE', 'silence')
+app.config['TRANSCRIPTION_WORKERS'] = int(os.environ.get('TRANSCRIPTION_WORKERS', '4'))
+
+# Caché de traducciones: LRU en memoria + SQLite en disco (TRANSLATION_CACHE_PATH vacío la desactiva en disco)
+app.config['TRANSLATION_CACHE_PATH'] = os.environ.get('TRANSLATION_CACHE_PATH', 'translation_cache.sqlite3')
+app.config['TRANSLATION_CACHE_MEMORY_ENTRIES'] = int(os.environ.get('TRANSLATION_CACHE_MEMORY_ENTRIES', '1024'))
+app.config['TRANSLATION_CACHE_DISK_ENTRIES'] = int(os.environ.get('TRANSLATION_CACHE_DISK_ENTRIES', '50000'))
+app.config['TRANSLATION_CACHE_TTL'] = int(os.environ.get('TRANSLATION_CACHE_TTL', str(30 * 24 * 3600)))
+app.config['TRANSLATOR_POOL_SIZE'] = int(os.environ.get('TRANSLATOR_POOL_SIZE', '4'))
+
+# Evaluación por lotes (/batch): procesos del pool, número máximo de audios por
+# zip y tamaño máximo del zip subido y de su contenido descomprimido
+app.config['BATCH_WORKERS'] = int(os.environ.get('BATCH_WORKERS', '2'))
+app.config['BATCH_MAX_FILES'] = int(os.environ.get('BATCH_MAX_FILES', '500'))
+app.config['BATCH_MAX_BYTES'] = int(os.environ.get('BATCH_MAX_BYTES', str(2 * 1024 ** 3)))
+
+# Formato común del audio: mono, 16 bits, AUDIO_SAMPLE_RATE Hz (0 para conservar
+# el original). Los formatos comprimidos (mp3, ogg, webm, m4a) necesitan ffmpeg
+app.config['AUDIO_SAMPLE_RATE'] = int(os.environ.get('AUDIO_SAMPLE_RATE', '16000'))
+app.config['FFMPEG_BINARY'] = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+app.config['TRANSCODE_TIMEOUT'] = float(os.environ.get('TRANSCODE_TIMEOUT', '300'))
+
+# Pausa mínima (s) para contar un silencio interno como pausa en el análisis de fluidez
+app.config['MIN_PAUSE_SECONDS'] = float(os.environ.get('MIN_PAUSE_SECONDS', '0.25'))
+
+# Modo streaming: /upload devuelve la página enseguida y cada etapa llega por
+# Server-Sent Events (/events/<hash>) en cuanto termina
+app.config['STREAM_RESULTS'] = os.environ.get('STREAM_RESULTS') == '1'
+
+# Protección de los servicios externos (ver resilience.py): llamadas simultáneas
+# y tiempo máximo por servicio, reintentos con espera exponencial, cola de espera
+# acotada y circuit breaker
+app.config['RECOGNIZER_CONCURRENCY'] = int(os.environ.get('RECOGNIZER_CONCURRENCY', '4'))
+app.config['RECOGNIZER_TIMEOUT'] = float(os.environ.get('RECOGNIZER_TIMEOUT', '30'))
+app.config['TRANSLATOR_CONCURRENCY'] = int(os.environ.get('TRANSLATOR_CONCURRENCY', '4'))
+app.config['TRANSLATOR_TIMEOUT'] = float(os.environ.get('TRANSLATOR_TIMEOUT', '10'))
+app.config['BACKEND_RETRIES'] = int(os.environ.get('BACKEND_RETRIES', '2'))
+app.config['BACKEND_BACKOFF_BASE'] = float(os.environ.get('BACKEND_BACKOFF_BASE', '0.5'))
+app.config['BACKEND_BACKOFF_MAX'] = float(os.environ.get('BACKEND_BACKOFF_MAX', '8'))
+app.config['BACKEND_QUEUE_SIZE'] = int(os.environ.get('BACKEND_QUEUE_SIZE', '32'))
+app.config['BACKEND_QUEUE_TIMEOUT'] = float(os.environ.get('BACKEND_QUEUE_TIMEOUT', '10'))
+app.config['BREAKER_FAILURE_THRESHOLD'] = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', '5'))
+app.config['BREAKER_RESET_TIMEOUT'] = float(os.environ.get('BREAKER_RESET_TIMEOUT', '30'))
+
+# Modo asíncrono: /upload encola el trabajo y devuelve un id de trabajo
+app.config['ASYNC_UPLOADS'] = os.environ.get('ASYNC_UPLOADS') == '1'
+app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', '4'))
+app.config['JOB_MAX_PENDING'] = int(os.environ.get('JOB_MAX_PENDING', '100'))
+# Un trabajo guardado en cola o en curso sin cambios durante más de estos
+# segundos se da por abandonado (worker caído o estado sin guardar)
+app.config['JOB_STALE_SECONDS'] = int(os.environ.get('JOB_STALE_SECONDS', '600'))
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+_translation_service = None
+_translation_service_lock = threading.Lock()
+
+_upload_store = None
+_upload_store_lock = threading.Lock()
+
+_synonym_index = None
+_synonym_index_lock = threading.Lock()
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+def _translation_stat(name):
+    return lambda: get_translation_service().stats()[name]
+
+# Métricas calculadas al exportar: caché de traducciones y trabajos en cola
+metrics.registry.counter_callback('eva_translation_cache_memory_hits_total',
+                                  'Aciertos de la caché de traducciones en memoria',
+                                  _translation_stat('memory_hits'))
+metrics.registry.counter_callback('eva_translation_cache_disk_hits_total',
+                                  'Aciertos de la caché de traducciones en disco',
+                                  _translation_stat('disk_hits'))
+metrics.registry.counter_callback('eva_translation_cache_misses_total',
+                                  'Fallos de la caché de traducciones',
+                                  _translation_stat('misses'))
+metrics.registry.counter_callback('eva_translation_external_calls_total',
+                                  'Llamadas reales al servicio de traducción',
+                                  _translation_stat('external_calls'))
+metrics.registry.gauge('eva_jobs_pending', 'Trabajos asíncronos en cola o en ejecución',
+                       lambda: get_job_queue().pending_count())
+
+_circuit_state_values = {'closed': 0, 'half_open': 1, 'open': 2}
+
+def _backend_stat(name, convert=None):
+    def collect():
+        values = {}
+        for backend_name, stats in backend_stats().items():
+            values[(backend_name,)] = convert(stats[name]) if convert else stats[name]
+        return values
+    return collect
+
+# Métricas de los servicios externos, una serie por servicio
+metrics.registry.gauge('eva_backend_queue_depth', 'Llamadas esperando un hueco libre o el cierre del circuito',
+                       _backend_stat('queue_depth'), label_names=('backend',))
+metrics.registry.gauge('eva_backend_in_flight', 'Llamadas en curso al servicio externo',
+                       _backend_stat('in_flight'), label_names=('backend',))
+metrics.registry.gauge('eva_backend_circuit_state', 'Estado del circuito (0 cerrado, 1 semiabierto, 2 abierto)',
+                       _backend_stat('state', _circuit_state_values.get), label_names=('backend',))
+metrics.registry.counter_callback('eva_backend_retries_total', 'Reintentos de llamadas al servicio externo',
+                                  _backend_stat('retries'), label_names=('backend',))
+metrics.registry.counter_callback('eva_backend_timeouts_total', 'Llamadas que superaron el tiempo máximo',
+                                  _backend_stat('timeouts'), label_names=('backend',))
+metrics.registry.counter_callback('eva_backend_rejected_total',
+                                  'Llamadas rechazadas sin contactar el servicio (cola llena o circuito abierto)',
+                                  _backend_stat('rejected'), label_names=('backend',))
+
+def get_upload_store():
+    # El almacén se rehace si cambia la carpeta de subidas
+    global _upload_store
+    with _upload_store_lock:
+        if _upload_store is None or _upload_store.folder != app.config['UPLOAD_FOLDER']:
+            _upload_store = UploadStore(app.config['UPLOAD_FOLDER'],
+                                        max_upload_bytes=app.config['MAX_CONTENT_LENGTH'],
+                                        max_age=app.config['UPLOAD_MAX_AGE'],
+                                        max_total_bytes=app.config['UPLOAD_MAX_TOTAL_BYTES'])
+        return _upload_store
+
+def get_translation_service():
+    # Un único traductor con caché por proceso; el pool se rehace si cambia TRANSLATOR_FACTORY
+    global _translation_service
+    with _translation_service_lock:
+        factory = app.config['TRANSLATOR_FACTORY']
+        if _translation_service is None:
+            cache = TranslationCache(app.config['TRANSLATION_CACHE_PATH'] or None,
+                                     max_memory_entries=app.config['TRANSLATION_CACHE_MEMORY_ENTRIES'],
+                                     max_disk_entries=app.config['TRANSLATION_CACHE_DISK_ENTRIES'],
+                                     ttl=app.config['TRANSLATION_CACHE_TTL'])
+            pool = TranslatorPool(factory, size=app.config['TRANSLATOR_POOL_SIZE'])
+            _translation_service = CachedTranslator(pool, cache)
+        elif _translation_service.pool.factory is not factory:
+            _translation_service.pool = TranslatorPool(factory, size=app.config['TRANSLATOR_POOL_SIZE'])
+        _translation_service.backend = get_backend('translator')
+        return _translation_service
+
+def _backend_settings(name):
+    prefix = name.upper()
+    return (app.config[f'{prefix}_CONCURRENCY'], app.config[f'{prefix}_TIMEOUT'],
+            app.config['BACKEND_RETRIES'], app.config['BACKEND_BACKOFF_BASE'], app.config['BACKEND_BACKOFF_MAX'],
+            app.config['BACKEND_QUEUE_SIZE'], app.config['BACKEND_QUEUE_TIMEOUT'],
+            app.config['BREAKER_FAILURE_THRESHOLD'], app.config['BREAKER_RESET_TIMEOUT'])
+
+def get_backend(name):
+    # Protección de un servicio externo ('recognizer' o 'translator'); se rehace
+    # si cambia su configuración
+    with _backends_lock:
+        settings = _backend_settings(name)
+        entry = _backends.get(name)
+        if entry is None or entry[0] != settings:
+            (concurrency, timeout, retries, backoff_base, backoff_max,
+             queue_size, queue_timeout, failure_threshold, reset_timeout) = settings
+            if name == 'recognizer':
+                import speech_recognition as sr
+                # "No se entendió el audio" es una respuesta válida del servicio
+                errors = {'retry_on': (sr.RequestError, OSError), 'no_retry': (sr.UnknownValueError,)}
+            else:
+                errors = {'retry_on': (Exception,), 'timeout_errors': _translator_timeout_errors()}
+            backend = Backend(name, max_concurrency=concurrency, max_queue=queue_size,
+                              queue_timeout=queue_timeout, timeout=timeout, retries=retries,
+                              backoff_base=backoff_base, backoff_max=backoff_max,
+                              failure_threshold=failure_threshold, reset_timeout=reset_timeout, **errors)
+            entry = _backends[name] = (settings, backend)
+        return entry[1]
+
+def _translator_timeout_errors():
+    # googletrans usa httpx, cuyos errores de tiempo agotado no heredan de
+    # TimeoutError (y la versión que fija googletrans no tiene TimeoutException)
+    try:
+        import httpx
+    except ImportError:
+        return (TimeoutError,)
+    names = ('TimeoutException', 'ConnectTimeout', 'ReadTimeout', 'WriteTimeout', 'PoolTimeout')
+    return (TimeoutError,) + tuple(getattr(httpx, name) for name in names if hasattr(httpx, name))
+
+def backend_stats():
+    # Estado de los servicios externos que ya se han usado en este proceso
+    with _backends_lock:
+        return {name: backend.stats() for name, (_, backend) in _backends.items()}
+
+def _reset_backends_after_fork():
+    # Un proceso hijo empieza con sus propios circuitos y contadores; el lock
+    # pudo copiarse tomado por otro hilo del padre
+    global _backends_lock
+    _backends_lock = threading.Lock()
+    _backends.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_backends_after_fork)
+
+def get_job_queue():
+    # El pool se crea con la configuración vigente la primera vez que se usa
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(max_workers=app.config['JOB_WORKERS'],
+                                  max_pending=app.config['JOB_MAX_PENDING'], on_update=save_job_state)
+        return _job_queue
+
+def job_state(job):
+    state = job.to_dict()
+    if job.status == DONE:
+        state['result'] = job.result
+    return state
+
+def save_job_state(job):
+    # El id del trabajo es el hash del audio: su estado se guarda en el almacén
+    # para que cualquier worker pueda responder a /status y /result
+    get_upload_store().save_job(job.id, job_state(job))
+
+def get_synonym_index():
+    # El índice se carga en la primera comparación de textos
+    global _synonym_index
+    with _synonym_index_lock:
+        if _synonym_index is None:
+            _synonym_index = load_synonym_index(app.config['SYNONYMS_PATH'],
+                                                app.config['SYNONYMS_CACHE_PATH'] or None)
+        return _synonym_index
+
+def create_app(config=None):
+    # Punto de entrada para el servidor WSGI ("from app import create_app;
+    # application = create_app()"). Solo aplica la configuración: las bibliotecas
+    # de audio y traducción, las reglas de puntuación y el índice de sinónimos se
+    # cargan en la primera petición que los usa
+    if config:
+        app.config.update(config)
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    return app
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
-def clean_text(text):
-    # Eliminar signos de puntuación y convertir a minúsculas
-    text = re.sub(r'[^\w\s]', '', text)  # Eliminar todo excepto letras y espacios
-    text = text.lower()  # Convertir a minúsculas
-    return text
-
-def replace_synonyms(text, synonyms_dict):
-    # Reemplazar sinónimos en el texto
-    for key, synonyms in synonyms_dict.items():
-        for synonym in synonyms:
-            text = text.replace(synonym, key)
-    return text
-
-def are_synonyms(word1, word2, synonyms_dict):
-    # Comprobar si las palabras son sinónimos
-    return (word1 in synonyms_dict and word2 in synonyms_dict[word1]) or \
-        (word2 in synonyms_dict and word1 in synonyms_dict[word2])
-
-def calculate_difference_and_print_changes(text1, text2, synonyms_dict):
+def calculate_difference_and_print_changes(text1, text2, synonym_index):
     # Limpiar los textos
     cleaned_text1 = clean_text(text1)
     cleaned_text2 = clean_text(text2)
 
-    # Reemplazar sinónimos en los textos
-    cleaned_text1 = replace_synonyms(cleaned_text1, synonyms_dict)
-    cleaned_text2 = replace_synonyms(cleaned_text2, synonyms_dict)
+    # Reemplazar sinónimos en los textos (una sola pasada con el índice precompilado)
+    cleaned_text1 = synonym_index.normalize(cleaned_text1)
+    cleaned_text2 = synonym_index.normalize(cleaned_text2)
 
     # Dividir los textos en palabras
     words1 = cleaned_text1.split()
     words2 = cleaned_text2.split()
 
-    # Usar SequenceMatcher para calcular las diferencias
-    matcher = SequenceMatcher(None, words1, words2)
-    differences = matcher.get_opcodes()
-
-    # Calcular el número de diferencias
+    # Calcular las diferencias palabra a palabra (borrados, inserciones y sustituciones)
     num_differences = 0
     changes = []
 
-    for tag, i1, i2, j1, j2 in differences:
-        if tag == 'replace':
-            # Si hay un reemplazo, imprime las palabras cambiadas
-            for i in range(i1, i2):
-                # Verificar que j1 no exceda el tamaño de words2
-                if j1 < len(words2):
-                    if not are_synonyms(words1[i], words2[j1], synonyms_dict):
-                        changes.append(f"{words1[i]} --> {words2[j1]}")
-                        num_differences += 1
-                    j1 += 1  # Incrementar j1 solo si está dentro del rango
-        elif tag == 'delete':
-            for i in range(i1, i2):
-                changes.append(f"{words1[i]} --> (deleted)")
+    for change in diff_words(words1, words2):
+        if change.op == SUBSTITUTE:
+            # Las sustituciones por un sinónimo no cuentan como cambio
+            if not synonym_index.are_synonyms(change.old_word, change.new_word):
+                changes.append(f"{change.old_word} --> {change.new_word}")
                 num_differences += 1
-        elif tag == 'insert':
-            for j in range(j1, j2):
-                # Verificar que j no exceda el tamaño de words2
-                if j < len(words2):
-                    changes.append(f"(inserted) --> {words2[j]}")
-                    num_differences += 1
+        elif change.op == DELETE:
+            changes.append(f"{change.old_word} --> (deleted)")
+            num_differences += 1
+        else:
+            changes.append(f"(inserted) --> {change.new_word}")
+            num_differences += 1
 
     # Calcular el porcentaje de diferencia
     total_length = max(len(words1), len(words2))
@@ -100,71 +372,18 @@ def calculate_difference_and_print_changes(text1, text2, synonyms_dict):
 
     return percentage_difference, change_level
 
-# Definir un diccionario de sinónimos
-synonyms_dict = {
-    "i am": ["im", "i'm"],
-    "im": ["i am", "i'm"],
-    "happy": ["glad", "joyful"],
-    "it is": ["its"],
-    "is": ["its"],
-    "it": ["is"],
-    "quarter": ["room", "section", "part", "area"],
-    "okey": ["well", "alright", "fine"],
-    "okay": ["okey", "alright", "fine"],            
-    "i am": ["im", "i'm"],
-    "im": ["i am", "i'm"],
-    "i'm": ["i am", "im"],
-    "sad": ["unhappy", "sorrowful", "down", "blue", "melancholy"],
-    "happy": ["glad", "joyful", "cheerful", "content", "pleased"],
-    "big": ["large", "huge", "gigantic", "enormous", "vast"],
-    "small": ["tiny", "miniature", "petite", "compact", "little"],
-    "fast": ["quick", "swift", "rapid", "speedy", "hasty"],
-    "slow": ["leisurely", "unhurried", "delayed", "gradual", "sluggish"],
-    "good": ["great", "excellent", "fantastic", "wonderful", "nice"],
-    "bad": ["poor", "terrible", "awful", "horrible", "dreadful"],
-    "strong": ["powerful", "robust", "tough", "sturdy", "solid"],
-    "weak": ["fragile", "delicate", "frail", "feeble", "soft"],
-    "beautiful": ["attractive", "pretty", "lovely", "gorgeous", "stunning"],
-    "ugly": ["unattractive", "hideous", "unsightly", "ugliness", "repulsive"],
-    "smart": ["intelligent", "clever", "bright", "wise", "sharp"],
-    "dumb": ["stupid", "unintelligent", "ignorant", "foolish", "slow-witted"],
-    "strong": ["muscular", "powerful", "tough", "mighty"],
-    "weak": ["fragile", "delicate", "frail", "soft"],
-    "rich": ["wealthy", "affluent", "prosperous", "well-off"],
-    "poor": ["broke", "impoverished", "needy", "destitute", "underprivileged"],
-    "old": ["ancient", "elderly", "aged", "vintage", "senior"],
-    "young": ["youthful", "new", "teenage", "juvenile", "fresh"],
-    "hard": ["difficult", "challenging", "tough", "arduous", "strenuous"],
-    "easy": ["simple", "effortless", "straightforward", "light", "manageable"],
-    "quick": ["fast", "swift", "rapid", "speedy", "brisk"],
-    "slow": ["delayed", "sluggish", "unhurried", "gradual"],
-    "hot": ["warm", "scorching", "boiling", "sizzling", "heated"],
-    "cold": ["chilly", "frigid", "cool", "frosty", "icy"],
-    "angry": ["furious", "irritated", "mad", "enraged", "upset"],
-    "calm": ["peaceful", "relaxed", "composed", "serene", "tranquil"],
-    "clean": ["tidy", "neat", "organized", "spotless", "sanitary"],
-    "dirty": ["unclean", "messy", "filthy", "grimy", "soiled"],
-    "friendly": ["amiable", "sociable", "pleasant", "cordial", "companionable"],
-    "unfriendly": ["hostile", "cold", "aloof", "distant", "antagonistic"],
-    "strong": ["powerful", "robust", "tough", "mighty", "muscular"],
-    "weak": ["fragile", "delicate", "frail", "soft", "feeble"]
-}
-
-# Función para obtener la duración del archivo de audio
-def get_audio_duration(filepath):
-    # Cargar el archivo de audio
-    audio = AudioSegment.from_file(filepath)
-    # Obtener la duración en segundos
-    duration_seconds = len(audio) / 1000.0  # Pydub da la duración en milisegundos, lo convertimos a segundos
-    return duration_seconds
-
 # Función para calcular la fluidez
-def calculate_fluency(transcription, audio_filepath):
+def calculate_fluency(transcription, audio, analysis=None):
     # Contamos el número de palabras en la transcripción
     num_words = len(transcription.split())
 
-    # Obtener la duración del audio
-    audio_duration = get_audio_duration(audio_filepath)
+    # Analizar la voz y las pausas del audio ya decodificado (sin volver a leer el archivo)
+    if analysis is None:
+        analysis = analyze_audio_data(audio, app.config['MIN_PAUSE_SECONDS'])
+
+    # Duración desde la primera hasta la última trama con voz: el silencio inicial
+    # y final no cuenta (si no se detecta voz, se usa la duración completa)
+    audio_duration = speaking_seconds(analysis) or analysis.duration
 
     # Convertir la duración del audio a minutos
     audio_duration_minutes = audio_duration / 60.0
@@ -189,6 +408,21 @@ def calculate_fluency(transcription, audio_filepath):
 
     return fluency, fluency_level
 
+def speech_report(transcription, analysis):
+    # Velocidad de articulación (palabras por minuto de voz, sin contar las pausas),
+    # número de pausas y tiempo total en pausa
+    num_words = len(transcription.split())
+    if analysis.voiced_seconds > 0:
+        articulation_rate = num_words / (analysis.voiced_seconds / 60.0)
+    else:
+        articulation_rate = 0.0
+    return {'articulation_rate': round(articulation_rate, 1),
+            'pause_count': analysis.pause_count,
+            'pause_seconds': round(analysis.pause_seconds, 2),
+            'speaking_seconds': round(speaking_seconds(analysis), 2),
+            'leading_silence': round(analysis.leading_silence, 2),
+            'trailing_silence': round(analysis.trailing_silence, 2)}
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     # Verificar si se subió un archivo
@@ -202,34 +436,329 @@ def upload_file():
 
     if file:
         
-        if not file.filename.endswith('.wav'):
-            error_message = "Solo se permiten archivos WAV"
+        # El formato se reconoce por el contenido, no por la extensión del nombre
+        audio_format = sniff_format(file.stream.read(SNIFF_BYTES))
+        file.stream.seek(0)
+        if audio_format is None:
+            error_message = "Formato de audio no reconocido. Se admiten WAV, MP3, M4A, OGG, WebM y FLAC"
+            return render_template('index.html', error_message=error_message)
+        if audio_format not in NATIVE_FORMATS and not ffmpeg_available(app.config['FFMPEG_BINARY']):
+            error_message = "Este servidor solo admite archivos WAV, FLAC y AIFF"
             return render_template('index.html', error_message=error_message)
 
+        # Guardar el archivo en el almacén, con su hash como nombre
+        try:
+            with span('save'):
+                content_hash, filepath = get_upload_store().save(file.stream, AUDIO_EXTENSIONS[audio_format])
+        except UploadTooLargeError as e:
+            return render_template('index.html', error_message=str(e)), 413
+        metrics.upload_bytes.observe(os.path.getsize(filepath))
 
-        # Guardar el archivo subido en la carpeta 'uploads'
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], file.filename)
-        file.save(filepath)
+        # Un WAV dañado, truncado o vacío se rechaza aquí, antes de encolarlo
+        if audio_format == 'wav':
+            validate_wav(filepath)
 
-        # Transcribir el audio
-        transcription = transcribe_audio(filepath)
+        if app.config['STREAM_RESULTS'] and not wants_json():
+            return render_template('stream.html', content_hash=content_hash)
 
-        # Traducir el texto al español y luego al inglés
-        translated_text = translate_text(transcription)
+        if app.config['ASYNC_UPLOADS']:
+            return enqueue_upload(content_hash, filepath)
 
-        # Calcular el porcentaje de diferencia y las palabras cambiadas
+        # Pasar la transcripción, las traducciones, el porcentaje de diferencia, los cambios y la fluidez a la plantilla 'result.html'
+        return render_template('result.html', **process_upload(content_hash, filepath))
+
+@app.errorhandler(413)
+def upload_too_large(error):
+    error_message = "El archivo supera el tamaño máximo permitido"
+    if request.endpoint == 'batch_upload':
+        return jsonify(error=error_message), 413
+    return render_template('index.html', error_message=error_message), 413
+
+@app.errorhandler(UnsupportedAudioError)
+def unsupported_audio(error):
+    return render_template('index.html', error_message=str(error)), 415
+
+@app.errorhandler(BackendUnavailableError)
+@app.errorhandler(BackendTimeoutError)
+def backend_unavailable(error):
+    # El servicio de traducción no responde: 503 en lugar de un error interno
+    error_message = "El servicio de traducción no está disponible. Inténtalo de nuevo en unos segundos."
+    return render_template('index.html', error_message=error_message), 503, {'Retry-After': '30'}
+
+def process_upload(content_hash, filepath, progress=None):
+    return stages_to_result(process_upload_stages(content_hash, filepath, progress))
+
+def process_upload_stages(content_hash, filepath, progress=None):
+    # Un audio idéntico a uno ya procesado reutiliza su resultado
+    store = get_upload_store()
+    result = store.load_result(content_hash)
+    if result is not None:
+        result['fluency'] = tuple(result['fluency'])
+        yield from result_to_stages(result)
+        return
+
+    stages = []
+    for stage in process_audio_stages(filepath, progress):
+        stages.append(stage)
+        yield stage
+    result = stages_to_result(stages)
+
+    # No guardar resultados de errores del servicio, que pueden ser transitorios,
+    # ni transcripciones incompletas (algún fragmento falló)
+    if result['transcription'] not in (UNKNOWN_VALUE_MESSAGE, REQUEST_ERROR_MESSAGE) \
+            and not result['transcription_partial']:
+        store.save_result(content_hash, result)
+
+def process_audio(filepath, progress=None):
+    # Pipeline completo para un archivo ya guardado; progress(stage) informa de cada etapa
+    return stages_to_result(process_audio_stages(filepath, progress))
+
+def process_audio_stages(filepath, progress=None):
+    # El pipeline etapa a etapa: genera (etapa, datos) en cuanto termina cada una,
+    # para que el modo streaming pueda enviar cada resultado sin esperar al resto
+    if progress is None:
+        progress = lambda stage: None
+
+    # Decodificar el audio una sola vez, ya en el formato común (16 kHz mono);
+    # se comparte entre transcripción y fluidez
+    progress('transcription')
+    with span('decode'):
+        audio = load_audio(filepath, app.config['AUDIO_SAMPLE_RATE'] or None,
+                           app.config['FFMPEG_BINARY'], app.config['TRANSCODE_TIMEOUT'])
+
+    # Transcribir el audio
+    transcription, partial = transcribe_audio(audio)
+    yield 'transcription', {'transcription': transcription, 'transcription_partial': partial}
+
+    # Traducir el texto al español y luego al inglés
+    progress('translation')
+    translated_to_spanish = translate(transcription, src='en', dest='es')
+    print("Texto traducido al español:", translated_to_spanish)
+    yield 'spanish', {'spanish': translated_to_spanish}
+
+    translated_to_english = translate(translated_to_spanish, src='es', dest='en')
+    print("Texto traducido al inglés:", translated_to_english)
+    yield 'english', {'english': translated_to_english}
+
+    # Calcular el porcentaje de diferencia y las palabras cambiadas
+    progress('difference')
+    with span('difference'):
         percentage_difference, changes = calculate_difference_and_print_changes(
-            transcription, translated_text['english'], synonyms_dict
+            transcription, translated_to_english, get_synonym_index()
         )
+    yield 'difference', {'change_percentage': percentage_difference, 'changes': changes}
+
+    # Calcular la fluidez
+    progress('fluency')
+    with span('fluency'):
+        analysis = analyze_audio_data(audio, app.config['MIN_PAUSE_SECONDS'])
+        fluency = calculate_fluency(transcription, audio, analysis)
+        speech_analysis = speech_report(transcription, analysis)
+    yield 'fluency', {'fluency': fluency, 'speech_analysis': speech_analysis}
+
+def stages_to_result(stages):
+    # Reunir los datos de cada etapa en el diccionario que usa result.html
+    data = {}
+    for _, values in stages:
+        data.update(values)
+    return {'transcription': data['transcription'],
+            'transcription_partial': data.get('transcription_partial', False),
+            'translated_text': {'spanish': data['spanish'], 'english': data['english']},
+            'change_percentage': data['change_percentage'],
+            'changes': data['changes'], 'fluency': data['fluency'],
+            'speech_analysis': data.get('speech_analysis')}
+
+def result_to_stages(result):
+    # Etapas de un resultado ya calculado, en el mismo orden que el pipeline
+    return [('transcription', {'transcription': result['transcription'],
+                               'transcription_partial': result.get('transcription_partial', False)}),
+            ('spanish', {'spanish': result['translated_text']['spanish']}),
+            ('english', {'english': result['translated_text']['english']}),
+            ('difference', {'change_percentage': result['change_percentage'],
+                            'changes': result['changes']}),
+            ('fluency', {'fluency': result['fluency'],
+                         'speech_analysis': result.get('speech_analysis')})]
+
+def wants_json():
+    # Clientes de API (Accept: application/json) reciben JSON en lugar de HTML
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+def enqueue_upload(content_hash, filepath):
+    job_queue = get_job_queue()
 
-        # Calcular la fluidez
-        fluency = calculate_fluency(transcription, filepath)
-
-        # Pasar la transcripción, las traducciones, el porcentaje de diferencia, los cambios y la fluidez a la plantilla 'result.html'
-        return render_template('result.html', transcription=transcription, 
-                               translated_text=translated_text, 
-                               change_percentage=percentage_difference,
-                               changes=changes, fluency=fluency)
+    try:
+        job_id = job_queue.submit(process_upload, content_hash, filepath, job_id=content_hash)
+    except QueueFullError:
+        error_message = "El servidor está ocupado, inténtalo de nuevo en unos minutos"
+        if wants_json():
+            return jsonify(error=error_message), 503
+        return render_template('index.html', error_message=error_message), 503
+
+    if wants_json():
+        return jsonify(job_id=job_id, status_url=f"/status/{job_id}",
+                       result_url=f"/result/{job_id}"), 202
+    return render_template('pending.html', job_id=job_id), 202
+
+def batch_worker_config():
+    # Configuración que se envía a los procesos de /batch: solo valores simples
+    # (las funciones y clases, como las fábricas de los servicios, no se pueden
+    # enviar a un proceso nuevo y allí quedan las de por defecto)
+    return {key: value for key, value in app.config.items()
+            if isinstance(value, (str, int, float, bool, type(None)))}
+
+@app.route('/batch', methods=['POST'])
+def batch_upload():
+    # Recibe un zip de WAV y devuelve un resultado por archivo (JSONL o CSV) a medida que terminan
+    file = request.files.get('file')
+    if file is None or not file.filename.lower().endswith('.zip'):
+        return jsonify(error="Se debe subir un archivo ZIP con archivos WAV"), 400
+
+    fmt = request.args.get('format', 'jsonl')
+    if fmt not in ('jsonl', 'csv'):
+        return jsonify(error="Formato no soportado: usa jsonl o csv"), 400
+
+    tmp_dir = tempfile.mkdtemp(prefix='batch-')
+    try:
+        files = batch.extract_zip(file.stream, tmp_dir, max_files=app.config['BATCH_MAX_FILES'],
+                                  max_total_bytes=app.config['BATCH_MAX_BYTES'])
+    except (zipfile.BadZipFile, ValueError) as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return jsonify(error=str(e)), 400
+
+    def generate():
+        start = time.perf_counter()
+        processed = errors = 0
+        records = batch.run_batch(files, app.config['BATCH_WORKERS'], batch_worker_config())
+        try:
+            for record in records:
+                yield batch.format_record(record, fmt, write_header=processed == 0)
+                processed += 1
+                errors += bool(record['error'])
+            if fmt == 'jsonl':
+                summary = batch.throughput_summary(processed, errors, time.perf_counter() - start)
+                yield json.dumps({'summary': summary}) + "\n"
+        finally:
+            # Cliente desconectado: cancelar los archivos que aún no han empezado
+            records.close()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    mimetype = 'application/x-ndjson' if fmt == 'jsonl' else 'text/csv'
+    return Response(generate(), mimetype=mimetype)
+
+_content_hash_re = re.compile(r'^[0-9a-f]{64}$')
+
+def find_upload(content_hash):
+    # Audio subido con ese hash, con la extensión de su formato
+    store = get_upload_store()
+    for extension in AUDIO_EXTENSIONS.values():
+        filepath = store.path_for(content_hash, extension)
+        if os.path.exists(filepath):
+            return filepath
+    return None
+
+def sse_event(event, data):
+    # Un evento de Server-Sent Events con los datos en JSON
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/events/<content_hash>')
+def upload_events(content_hash):
+    # Resultados de una subida en modo streaming, un evento por etapa. El pipeline
+    # se ejecuta dentro del generador, así que ocupa el worker el mismo tiempo que
+    # el modo síncrono; un resultado ya guardado se envía de una vez
+    if not _content_hash_re.match(content_hash):
+        abort(404)
+    filepath = find_upload(content_hash)
+    if filepath is None:
+        abort(404)
+
+    def generate():
+        # Un comentario inicial abre la conexión antes de la primera etapa
+        yield ": inicio\n\n"
+        try:
+            for stage, data in process_upload_stages(content_hash, filepath):
+                yield sse_event(stage, data)
+        except Exception as e:
+            yield sse_event('failure', {'error': "No se pudo procesar el audio: " + (str(e) or type(e).__name__)})
+            return
+        yield sse_event('done', {})
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.before_request
+def start_upload_timing():
+    # Recoger los tiempos de cada etapa para la cabecera Server-Timing de /upload
+    if request.endpoint == 'upload_file':
+        g.request_start = time.perf_counter()
+        metrics.begin_request()
+
+@app.after_request
+def add_server_timing(response):
+    if request.endpoint == 'upload_file' and 'request_start' in g:
+        timings = metrics.end_request()
+        timings.append(('total', time.perf_counter() - g.request_start))
+        response.headers['Server-Timing'] = metrics.server_timing_header(timings)
+    return response
+
+@app.route('/metrics')
+def metrics_endpoint():
+    # Métricas en formato de texto de Prometheus
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/stats/translation')
+def translation_stats():
+    # Aciertos/fallos de la caché y llamadas reales al servicio de traducción
+    return jsonify(get_translation_service().stats())
+
+@app.route('/stats/backends')
+def backends_stats():
+    # Estado del circuito, colas y contadores de cada servicio externo
+    return jsonify(backend_stats())
+
+def find_job(job_id):
+    # Estado de un trabajo: el de este proceso si lo ejecuta él; si no, el que
+    # guardó el worker que lo ejecuta o, sin trabajo, el resultado ya guardado
+    # de ese audio. None si no existe. Un estado guardado en cola o en curso
+    # que lleva JOB_STALE_SECONDS sin cambiar se devuelve como error
+    if not _content_hash_re.match(job_id):
+        return None
+    job = get_job_queue().get(job_id)
+    if job is not None:
+        return job_state(job)
+    store = get_upload_store()
+    state = store.load_job(job_id)
+    if state is None:
+        result = store.load_result(job_id)
+        if result is None:
+            return None
+        state = {'id': job_id, 'status': DONE, 'stage': None, 'error': None, 'result': result}
+    elif state['status'] in (QUEUED, RUNNING) and \
+            time.time() - state.get('updated_at', 0) > app.config['JOB_STALE_SECONDS']:
+        state['status'] = ERROR
+        state['error'] = "el trabajo se interrumpió"
+    if state.get('result') is not None:
+        state['result']['fluency'] = tuple(state['result']['fluency'])
+    return state
+
+@app.route('/status/<job_id>')
+def job_status(job_id):
+    state = find_job(job_id)
+    if state is None:
+        return jsonify(error="Trabajo no encontrado"), 404
+    state.pop('result', None)
+    return jsonify(state)
+
+@app.route('/result/<job_id>')
+def job_result(job_id):
+    state = find_job(job_id)
+    if state is None:
+        abort(404)
+    if state['status'] == DONE:
+        return render_template('result.html', **state['result'])
+    if state['status'] == ERROR:
+        error_message = "No se pudo procesar el audio: " + state['error']
+        return render_template('index.html', error_message=error_message), 500
+    return render_template('pending.html', job_id=job_id), 202
 
 def calculate_changes_percentage(original_text, translated_text):
     # Usamos difflib para comparar los dos textos
@@ -240,181 +769,52 @@ def calculate_changes_percentage(original_text, translated_text):
     change_percentage = (1 - similarity) * 100
     return change_percentage
 
-def transcribe_audio(filepath):
-    recognizer = sr.Recognizer()
-    audio_file = sr.AudioFile(filepath)
+UNKNOWN_VALUE_MESSAGE = "No se pudo entender el audio."
+REQUEST_ERROR_MESSAGE = "Hubo un error al contactar el servicio de transcripción."
+PARTIAL_TRANSCRIPTION_MESSAGE = "La transcripción está incompleta: no se pudo transcribir parte del audio."
+
+def recognize_speech(audio):
+    import speech_recognition as sr
 
-    with audio_file as source:
-        audio = recognizer.record(source)  # Graba todo el contenido del archivo
+    recognizer = app.config['RECOGNIZER_FACTORY']()
+    try:
+        return get_backend('recognizer').call(recognizer.recognize_google, audio, language="en-US")
+    except (BackendUnavailableError, BackendTimeoutError) as e:
+        # Para el resto del pipeline es un error más del servicio de transcripción
+        raise sr.RequestError(str(e))
+
+def transcribe_audio(audio):
+    # Devuelve (texto, incompleto): incompleto si falló algún fragmento de la transcripción por fragmentos
+    import speech_recognition as sr
 
+    failed = 0
     try:
-        # Usamos el reconocimiento de Google para transcribir el audio
-        transcription = recognizer.recognize_google(audio, language="en-US")
+        with span('transcription'):
+            if app.config['CHUNKED_TRANSCRIPTION']:
+                # Dividir en fragmentos y transcribirlos en paralelo (un solo fragmento si el audio es corto)
+                transcription, failed = transcribe_chunked(audio, recognize_speech,
+                                                   chunk_seconds=app.config['CHUNK_SECONDS'],
+                                                   overlap_seconds=app.config['CHUNK_OVERLAP_SECONDS'],
+                                                   mode=app.config['CHUNK_MODE'],
+                                                   max_workers=app.config['TRANSCRIPTION_WORKERS'],
+                                                   retries=0)  # Los reintentos los hace recognize_speech
+            else:
+                # Usamos el reconocimiento de Google para transcribir el audio
+                transcription = recognize_speech(audio)
         print("Texto transcrito:", transcription)
 
         # Llamamos a la función para agregar signos de interrogación y puntos
-        result = add_question_marks(transcription)
+        with span('punctuation'):
+            result = add_question_marks(transcription)
         print("Texto corregido v2:", result) 
-        return result
+        return result, failed > 0
 
     except sr.UnknownValueError:
-        return "No se pudo entender el audio."
+        return UNKNOWN_VALUE_MESSAGE, False
     except sr.RequestError:
-        return "Hubo un error al contactar el servicio de transcripción."
-
-def translate_text(text):
-    translator = Translator()
-
-    # Traducir el texto al español
-    translated_to_spanish = translator.translate(text, src='en', dest='es').text
-    print("Texto traducido al español:", translated_to_spanish)
-
-    # Traducir el texto al inglés
-    translated_to_english = translator.translate(translated_to_spanish, src='es', dest='en').text
-    print("Texto traducido al inglés:", translated_to_english)
-
-    return {'spanish': translated_to_spanish, 'english': translated_to_english}
-
-def add_question_marks(text):
-    question_words_combinations = [
-        ("who", ["is", "was", "are", "were", "did", "does"]),
-        ("what", ["is", "time", "are", "was", "were", "do", "does", "goes", "works"]),
-        ("where", ["is", "are", "does", "was", "were"]),
-        ("when", ["is", "was", "are", "were"]),
-        ("why", ["is", "are", "do", "does", "was", "were", "I", "you", "he", "she", "it"]),
-        ("how", ["is", "are", "do", "does", "was", "were", "many", "much"]),
-        ("which", ["is", "are", "was", "were"]),
-        ("whom", ["did", "does", "is", "was"]),
-        ("whose", ["is", "are"]),
-        ("how many", ["is", "are", "do", "does"]),
-        ("how much", ["is", "are", "does", "do"]),
-        ("how long", ["is", "are", "do", "does"]),
-        ("how far", ["is", "are", "do", "does"]),
-        ("how often", ["do", "does", "is", "are"]),
-        ("how old", ["is", "are"]),
-        ("how come", ["is", "are", "did"]),
-        ("what time", ["is", "does"]),
-        ("what kind", ["is", "are"]),
-        ("what else", ["is", "are"]),
-        ("what about", ["is", "are"]),
-        ("who else", ["is", "are"]),
-        ("who did", ["it", "you", "they"]),
-        ("who was", ["it", "he", "she"]),
-        ("who is", ["it", "he", "she"]),
-        ("will", ["I", "you", "he", "she", "we", "they"]),
-        ("can", ["I", "you", "he", "she", "we", "they"]),
-        ("could", ["I", "you", "he", "she", "we", "they"]),
-        ("would", ["I", "you", "he", "she", "we", "they"]),
-        ("do", ["I", "you", "he", "she", "it", "we", "they"]),
-        ("does", ["he", "she", "it"]),
-        ("did", ["I", "you", "he", "she", "it", "we", "they"]),
-        
-        ("is", ["he", "she", "it"]),
-        ("are", ["you", "we", "they"]),
-        ("am", ["I"]),
-        
-        ("was", ["I", "he", "she", "it"]),
-        ("were", ["you", "we", "they"]),
-        ("has", ["he", "she", "it"]),
-        ("have", ["I", "you", "we", "they"]),
-        ("had", ["I", "you", "he", "she", "it", "we", "they"]),
-        ("may", ["I", "you", "he", "she", "it", "we", "they"]),
-        ("might", ["I", "you", "he", "she", "it", "we", "they"]),
-        ("shall", ["I", "we"]),
-        ("should", ["I", "you", "he", "she", "it", "we", "they"]),
-        ("must", ["I", "you", "he", "she", "it", "we", "they"])
-    ]
-
-    # Lista de pronombres y sus combinaciones
-    pronouns_combinations = [
-        ("I", ["do", "don't", "am", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
-        ("you", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
-        ("we", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
-        ("they", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
-       
-        ("she", ["does", "doesn't", "is", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
-        ("he", ["does", "doesn't", "is", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
-        ("it", [ "is", "doesn't", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
-       
-        ("I'm", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("you're", ["welcome", "going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("we're", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("they're", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("she's", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("he's", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("it's", ["going", "a", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
-        ("thank", ["you"]),
-        ("thanks", ["so"]),
-        ("see", ["you soon", "you tomorrow", "you again"]),  
-        ("thanks", ["so", "for"]),
-        ("bye", ["bye"]),   
-        ("yes", ["I", "you", "we", "they", "she", "he", "it"]),
-        ("no", ["I", "you", "we", "they", "she", "he", "it"]), 
-        ("if", ["I", "you", "we", "they", "she", "he", "it"]),    
-        
-        ("the", ["book", "car", "house", "dog", "cat", "computer", "idea", "movie", "tree", "person", "problem", "question", "answer", "day", "night", "city", "town", "place", "school", "work", "friend", "family", "room", "party", "team", "teacher", "student", "company", "office", "restaurant", "game", "song", "event", "planet", "country", "continent", "mountain", "river", "lake", "ocean", "beach", "forest", "desert", "house", "street", "building", "shop", "store", "factory", "station", "bus", "train", "plane", "bike", "club", "service", "market", "home", "idea", "show", "problem", "discussion", "friendship", "relationship", "experience", "situation", "feeling", "thing", "place", "world", "universe", "moon", "star", "holiday", "celebration", "moment", "time", "space", "goal", "project", "plan", "dream", "wish", "challenge", "task", "plan", "activity", "journey", "experience", "opportunity", "idea", "meeting", "concept", "opinion", "thought", "discussion", "memory", "vision", "action", "decision", "topic", "news", "item", "object", "subject", "question", "answer", "result", "aspect", "case", "event", "strategy", "factor", "method", "technique", "idea", "argument", "resource", "role", "plan", "strategy", "solution", "problem", "debate", "point", "opinion", "reason", "goal", "wish", "success", "failure", "test", "exam", "study", "subject", "review", "review", "problem", "books", "cars", "houses", "dogs", "cats", "computers", "ideas", "movies", "trees", "persons", "problems", "questions", "answers", "days", "nights", "cities", "towns", "places", "schools", "works", "friends", "families", "rooms", "parties", "teams", "teachers", "students", "companies", "offices", "restaurants", "games", "songs", "events", "planets", "countries", "continents", "mountains", "rivers", "lakes", "oceans", "beaches", "forests", "deserts", "streets", "buildings", "shops", "stores", "factories", "stations", "buses", "trains", "planes", "bikes", "clubs", "services", "markets", "homes", "shows", "problems", "discussions", "friendships", "relationships", "experiences", "situations", "feelings", "things", "worlds", "universes", "moons", "stars", "holidays", "celebrations", "moments", "times", "spaces", "goals", "projects", "plans", "dreams", "wishes", "challenges", "tasks", "activities", "journeys", "opportunities", "meetings", "concepts", "opinions", "thoughts", "memories", "visions", "actions", "decisions", "topics", "news", "items", "objects", "subjects", "questions", "answers", "results", "aspects", "cases", "strategies", "factors", "methods", "techniques", "arguments", "resources", "roles", "solutions", "debates", "points", "reasons", "successes", "failures", "tests", "exams", "studies", "subjects", "reviews"])  
-    ]
-
-    # Construir la expresión regular a partir de la lista de combinaciones de pronombres
-    pronouns_pattern = "|".join([f"\\b{pronoun} ({'|'.join(combinations)})" for pronoun, combinations in pronouns_combinations])
-
-    # Extraer las palabras de pregunta de la lista de combinaciones
-    question_words = [pair[0] for pair in question_words_combinations]
-    question_words_pattern = "|".join(question_words)
-
-    # Primero agregamos signos de interrogación donde corresponde
-    match = re.search(rf"({question_words_pattern})(.*?)(\b{pronouns_pattern}\b)", text)
-
-    if match:
-        # Buscar el índice en el que comienza el pronombre
-        pronoun_start_index = match.start(3)
-
-        # Verificar que el índice se haya encontrado
-        if pronoun_start_index != -1:
-            # Buscar el índice antes de un espacio antes del pronombre
-            question_mark_position = pronoun_start_index - 1
-
-            # Insertar el signo de interrogación justo antes del pronombre
-            modified_text = text[:question_mark_position] + "?" + text[question_mark_position:]
-            return modified_text  # Retornar el texto modificado
-        else:
-            return text
-    else:
-        # Buscar las palabras de pregunta al principio de la oración sin pronombres
-        question_match = re.search(rf"({question_words_pattern})\b(.*)", text)
-
-        if question_match:
-            question_word = question_match.group(1)
-            rest_of_text = question_match.group(2).strip()
-
-            # Si no hay un pronombre después de la palabra de pregunta
-            if not re.search(pronouns_pattern, rest_of_text):
-                # Agregar el signo de interrogación al final
-                text = text + "?"
-            else:
-                # Si ya hay un pronombre, dejamos el texto igual
-                return text
-
-    # Añadir puntos en otros lugares donde corresponda
-    for pronoun, combinations in pronouns_combinations:
-        for combination in combinations:
-            # Buscar coincidencias de pronombre + verbo
-            text = re.sub(rf"(\b{pronoun} {combination}\b)(?!\?)", r". \1", text)
-
-    # Añadir un solo punto antes de la palabra de pregunta, si no está precedida de uno
-    text = re.sub(rf"(?<!\.)\s*(?=\b{question_words_pattern}\b)", ".", text)
-
-    # Reemplazar puntos consecutivos por un solo punto
-    text = re.sub(r"\.\.+", ".", text)
-
-    # Asegurar que haya un espacio después de cada punto
-    text = re.sub(r"(\.)(?=\S)", r". ", text)
-
-    # Eliminar espacios innecesarios antes del punto
-    text = re.sub(r"\s+\.", ".", text)
-
-    # Eliminar punto al inicio si existe
-    text = text.lstrip(".").lstrip()
-    
-    return text
+        return REQUEST_ERROR_MESSAGE, False
 
+def translate(text, src, dest):
+    # Una traducción, con la caché y el pool de clientes del proceso
+    with span(f'translate_{dest}'):
+        return get_translation_service().translate(text, src=src, dest=dest)
@@ -0,0 +1,225 @@
+import os
+import shutil
+import struct
+import subprocess
+import wave
+from collections import namedtuple
+
+# Capa de acceso al audio:
+#   - sniff_format reconoce el formato real por los primeros bytes, no por el
+#     nombre del archivo;
+#   - probe_wav lee la cabecera RIFF/WAV sin decodificar el archivo, y
+#     validate_wav la usa para rechazar WAV con la cabecera dañada o sin audio
+#     antes de encolarlos o decodificarlos (un WAV cortado se acepta con los
+#     datos que tenga, como hace wave);
+#   - load_audio decodifica el archivo una sola vez y lo normaliza a PCM mono
+#     de 16 bits a sample_rate (16 kHz, lo que necesita el reconocedor). El
+#     resultado (AudioData) se comparte entre la transcripción y el cálculo de
+#     fluidez. Los WAV se convierten por bloques en Python; los formatos
+#     comprimidos se decodifican con ffmpeg, que escribe el PCM ya convertido
+#     por una tubería, sin archivos intermedios.
+# speech_recognition solo se importa cuando hace falta decodificar.
+
+WavInfo = namedtuple("WavInfo", ["channels", "sample_rate", "sample_width", "num_frames", "duration"])
+
+# Formatos admitidos y la extensión con la que se guardan
+AUDIO_EXTENSIONS = {
+    "wav": ".wav",
+    "flac": ".flac",
+    "aiff": ".aiff",
+    "mp3": ".mp3",
+    "aac": ".aac",
+    "m4a": ".m4a",
+    "ogg": ".ogg",
+    "webm": ".webm",
+}
+# Formatos que speech_recognition decodifica sin ffmpeg
+NATIVE_FORMATS = ("wav", "flac", "aiff")
+
+SNIFF_BYTES = 12
+BLOCK_SECONDS = 10
+
+# Errores del módulo wave con archivos dañados (cabeceras truncadas o con
+# tamaños de chunk incoherentes)
+_WAVE_ERRORS = (wave.Error, EOFError, RuntimeError, struct.error)
+
+
+class UnsupportedAudioError(Exception):
+    pass
+
+
+def sniff_format(head):
+    # Formato a partir de los primeros SNIFF_BYTES bytes; None si no se reconoce
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC"):
+        return "aiff"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        # Contenedor EBML: WebM/Matroska (lo que graban los navegadores)
+        return "webm"
+    if head[4:8] == b"ftyp":
+        # Contenedor MP4 (m4a de los móviles)
+        return "m4a"
+    if head[:3] == b"ID3":
+        return "mp3"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # Sincronía de trama MPEG: capa 00 es AAC en ADTS, el resto MP3
+        return "aac" if head[1] & 0x06 == 0 else "mp3"
+    return None
+
+
+def sniff_file(filepath):
+    with open(filepath, "rb") as f:
+        return sniff_format(f.read(SNIFF_BYTES))
+
+
+def ffmpeg_available(ffmpeg="ffmpeg"):
+    return bool(ffmpeg) and shutil.which(ffmpeg) is not None
+
+
+def probe_wav(filepath):
+    # Leer solo las cabeceras de los chunks RIFF ("fmt " y "data")
+    file_size = os.path.getsize(filepath)
+    with open(filepath, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise ValueError("No es un archivo RIFF/WAVE")
+
+        fmt = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError("Archivo WAV sin chunk 'data'")
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                if len(fmt) < 16:
+                    raise ValueError("Chunk 'fmt ' incompleto")
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("Chunk 'data' antes de 'fmt '")
+                # Las grabaciones en streaming pueden dejar el tamaño a 0 o
+                # 0xFFFFFFFF, y las cortadas declaran más datos de los que hay:
+                # se cuenta solo lo que está en el archivo
+                data_size = file_size - f.tell()
+                if chunk_size != 0:
+                    data_size = min(chunk_size, data_size)
+                break
+            else:
+                # Saltar chunks que no interesan (LIST, fact, ...) sin leerlos
+                f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+
+    _, channels, sample_rate, byte_rate, block_align, bits_per_sample = struct.unpack("<HHIIHH", fmt[:16])
+    if block_align == 0:
+        block_align = channels * ((bits_per_sample + 7) // 8)
+    if byte_rate == 0:
+        byte_rate = sample_rate * block_align
+    if byte_rate == 0 or block_align == 0:
+        raise ValueError("Cabecera WAV inválida")
+
+    num_frames = data_size // block_align
+    return WavInfo(channels, sample_rate, block_align // max(channels, 1), num_frames, data_size / byte_rate)
+
+
+def validate_wav(filepath):
+    # Comprobar la cabecera sin decodificar el audio; UnsupportedAudioError si no sirve
+    try:
+        info = probe_wav(filepath)
+    except (ValueError, struct.error) as e:
+        raise UnsupportedAudioError(f"Archivo WAV no válido: {e}") from e
+    if info.num_frames == 0:
+        raise UnsupportedAudioError("El archivo WAV no contiene audio")
+    return info
+
+
+def load_audio(filepath, sample_rate=16000, ffmpeg="ffmpeg", timeout=300):
+    # Decodificar el archivo una sola vez; con sample_rate=None se conserva el
+    # formato original (solo WAV, FLAC y AIFF)
+    import speech_recognition as sr
+
+    audio_format = sniff_file(filepath)
+    if audio_format is None:
+        raise UnsupportedAudioError("Formato de audio no reconocido")
+
+    if audio_format == "wav":
+        validate_wav(filepath)
+    if audio_format == "wav" and sample_rate:
+        try:
+            return sr.AudioData(_read_wav_normalized(filepath, sample_rate), sample_rate, 2)
+        except _WAVE_ERRORS as e:
+            # WAV dañado o con una codificación que wave no lee (p. ej. float de
+            # 32 bits): ffmpeg lo intenta si está disponible
+            if not ffmpeg_available(ffmpeg):
+                raise UnsupportedAudioError("No se pudo leer el archivo WAV" + (f": {e}" if str(e) else "")) from e
+    if audio_format not in NATIVE_FORMATS or (sample_rate and ffmpeg_available(ffmpeg)):
+        return sr.AudioData(_transcode(filepath, sample_rate or 16000, ffmpeg, timeout), sample_rate or 16000, 2)
+
+    recognizer = sr.Recognizer()
+    try:
+        with sr.AudioFile(filepath) as source:
+            audio = recognizer.record(source)  # Graba todo el contenido del archivo
+    except (ValueError,) + _WAVE_ERRORS as e:
+        # speech_recognition lanza ValueError si no puede leer el archivo como WAV, AIFF ni FLAC
+        raise UnsupportedAudioError("No se pudo leer el archivo de audio" + (f": {e}" if str(e) else "")) from e
+    if sample_rate:
+        audio = sr.AudioData(audio.get_raw_data(convert_rate=sample_rate, convert_width=2), sample_rate, 2)
+    return audio
+
+
+def _read_wav_normalized(filepath, sample_rate, block_seconds=BLOCK_SECONDS):
+    # Leer el WAV por bloques y pasarlo a mono, 16 bits y sample_rate; si ya
+    # está en ese formato se copian los datos sin convertir
+    import audioop
+    import numpy as np
+
+    with wave.open(filepath, "rb") as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        if (channels, width, rate) == (1, 2, sample_rate):
+            return wav.readframes(wav.getnframes())
+
+        pcm = bytearray()
+        state = None
+        block_frames = max(1, int(block_seconds * rate))
+        while True:
+            block = wav.readframes(block_frames)
+            if not block:
+                break
+            if width == 1:
+                block = audioop.bias(block, 1, -128)  # Los WAV de 8 bits no tienen signo
+            if width != 2:
+                block = audioop.lin2lin(block, width, 2)
+            if channels > 1:
+                # Media de los canales en enteros, sumando canal a canal (sum(axis=1)
+                # sobre filas de 2 muestras es varias veces más lento)
+                samples = np.frombuffer(block, dtype="<i2").reshape(-1, channels)
+                total = samples[:, 0].astype(np.int32)
+                for channel in range(1, channels):
+                    total += samples[:, channel]
+                block = (total // channels).astype("<i2").tobytes()
+            if rate != sample_rate:
+                block, state = audioop.ratecv(block, 2, 1, rate, sample_rate, state)
+            pcm += block
+    return bytes(pcm)
+
+
+def _transcode(filepath, sample_rate, ffmpeg, timeout):
+    # ffmpeg decodifica y convierte a la vez y entrega PCM crudo por stdout
+    command = [ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-i", filepath,
+               "-vn", "-ac", "1", "-ar", str(sample_rate), "-f", "s16le", "-acodec", "pcm_s16le", "pipe:1"]
+    try:
+        completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+    except FileNotFoundError:
+        raise UnsupportedAudioError("Este formato de audio necesita ffmpeg, que no está instalado")
+    except subprocess.TimeoutExpired:
+        raise UnsupportedAudioError(f"La conversión del audio superó {timeout} s")
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise UnsupportedAudioError("No se pudo decodificar el audio" + (f": {message[-1]}" if message else ""))
+    return completed.stdout
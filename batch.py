@@ -0,0 +1,210 @@
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from audio_probe import AUDIO_EXTENSIONS
+
+# Evaluación por lotes: ejecuta el mismo pipeline que /upload (transcripción,
+# traducción, diferencias y fluidez) sobre muchos audios con un pool de procesos
+# y escribe un resultado por archivo en JSONL o CSV a medida que terminan.
+#
+# Uso:
+#   python batch.py grabaciones/ clase.zip otro.wav movil.m4a -o resultados.jsonl
+#   python batch.py grabaciones/ -o resultados.csv --format csv --workers 8
+# Si el archivo de salida ya existe, se saltan los archivos que ya tienen
+# resultado (permite reanudar un lote interrumpido).
+
+FIELDS = ["file", "transcription", "spanish", "english", "change_percentage",
+          "change_level", "fluency_wpm", "fluency_level", "articulation_rate", "pause_count",
+          "pause_seconds", "error"]
+
+
+def evaluate_file(name, path):
+    # Se importa aquí para que cada proceso del pool inicialice la aplicación una vez
+    import app
+
+    record = dict.fromkeys(FIELDS, "")
+    record["file"] = name
+    try:
+        result = app.process_audio(path)
+        record.update({
+            "transcription": result["transcription"],
+            "spanish": result["translated_text"]["spanish"],
+            "english": result["translated_text"]["english"],
+            "change_percentage": result["change_percentage"],
+            "change_level": result["changes"],
+            "fluency_wpm": result["fluency"][0],
+            "fluency_level": result["fluency"][1],
+        })
+        speech_analysis = result.get("speech_analysis") or {}
+        for field in ("articulation_rate", "pause_count", "pause_seconds"):
+            record[field] = speech_analysis.get(field, "")
+        if result.get("transcription_partial"):
+            # Se marca como error para que al reanudar el lote se vuelva a evaluar
+            record["error"] = app.PARTIAL_TRANSCRIPTION_MESSAGE
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def _init_worker(config):
+    # Los procesos del pool empiezan de cero (spawn): aplicar la configuración
+    # de quien lanza el lote (p. ej. la del servidor para /batch)
+    if config:
+        import app
+        app.create_app(config)
+
+
+def is_audio_name(name):
+    return os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS.values()
+
+
+def extract_zip(zip_path_or_file, dest, max_files=1000, max_total_bytes=2 * 1024 ** 3):
+    # Extraer solo los archivos de audio del zip, sin rutas (evita escribir fuera de dest)
+    # y con límites de número de archivos y tamaño descomprimido
+    files = []
+    total = 0
+    with zipfile.ZipFile(zip_path_or_file) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not is_audio_name(info.filename):
+                continue
+            if os.path.basename(info.filename).startswith("."):
+                continue
+            total += info.file_size
+            if len(files) >= max_files or total > max_total_bytes:
+                raise ValueError("El zip supera el número o el tamaño máximo de archivos")
+            target = os.path.join(dest, f"{len(files):06d}_{os.path.basename(info.filename)}")
+            with archive.open(info) as source, open(target, "wb") as out:
+                while True:
+                    chunk = source.read(64 * 1024)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+            files.append((info.filename, target))
+    return files
+
+
+def collect_inputs(paths, tmp_dir):
+    # Devuelve una lista de (nombre, ruta) a partir de archivos, carpetas y zips
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if is_audio_name(name):
+                        full = os.path.join(root, name)
+                        files.append((os.path.relpath(full, path), full))
+        elif path.lower().endswith(".zip"):
+            dest = os.path.join(tmp_dir, f"zip{len(files)}")
+            os.makedirs(dest, exist_ok=True)
+            prefix = os.path.basename(path)
+            files.extend((f"{prefix}/{name}", full) for name, full in extract_zip(path, dest))
+        else:
+            files.append((os.path.basename(path), path))
+    return files
+
+
+def run_batch(files, workers=None, config=None):
+    # Genera los resultados a medida que terminan (no en el orden de entrada).
+    # Procesos con spawn y no fork: no heredan la conexión SQLite, los hilos ni
+    # los pools del proceso que lanza el lote
+    if not files:
+        return
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(config,))
+    try:
+        futures = [executor.submit(evaluate_file, name, path) for name, path in files]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Si quien consume deja de leer (cliente desconectado, Ctrl+C), los
+        # archivos pendientes se cancelan en vez de procesar el lote entero
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def format_record(record, fmt, write_header=False):
+    if fmt == "jsonl":
+        return json.dumps(record, ensure_ascii=False) + "\n"
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    if write_header:
+        writer.writeheader()
+    writer.writerow(record)
+    return buffer.getvalue()
+
+
+def completed_files(output_path, fmt):
+    # Archivos que ya tienen resultado en una salida anterior
+    if not os.path.exists(output_path):
+        return set()
+    done = set()
+    with open(output_path, encoding="utf-8", newline="") as f:
+        if fmt == "jsonl":
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Última línea incompleta si el proceso se interrumpió
+                if not record.get("error"):
+                    done.add(record["file"])
+        else:
+            for record in csv.DictReader(f):
+                if record.get("file") and not record.get("error"):
+                    done.add(record["file"])
+    return done
+
+
+def throughput_summary(processed, errors, elapsed):
+    return {
+        "files": processed,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "files_per_minute": round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evalúa muchos archivos de audio con el pipeline de /upload")
+    parser.add_argument("inputs", nargs="+", help="archivos de audio (.wav, .mp3, .m4a...), carpetas o archivos .zip")
+    parser.add_argument("-o", "--output", required=True, help="archivo de resultados")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="por defecto, según la extensión de --output")
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool (por defecto, uno por CPU)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = collect_inputs(args.inputs, tmp_dir)
+        done = completed_files(args.output, fmt)
+        pending = [(name, path) for name, path in files if name not in done]
+        print(f"{len(files)} archivos, {len(files) - len(pending)} ya evaluados, {len(pending)} pendientes",
+              file=sys.stderr)
+
+        write_header = fmt == "csv" and (not os.path.exists(args.output) or os.path.getsize(args.output) == 0)
+        start = time.perf_counter()
+        processed = errors = 0
+        with open(args.output, "a", encoding="utf-8", newline="") as out:
+            for record in run_batch(pending, args.workers):
+                out.write(format_record(record, fmt, write_header))
+                out.flush()
+                write_header = False
+                processed += 1
+                errors += bool(record["error"])
+                print(f"[{processed}/{len(pending)}] {record['file']}", file=sys.stderr)
+        summary = throughput_summary(processed, errors, time.perf_counter() - start)
+
+    print(f"{summary['files']} archivos en {summary['seconds']} s "
+          f"({summary['files_per_minute']} archivos/min, {summary['errors']} errores)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
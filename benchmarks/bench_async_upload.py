@@ -0,0 +1,87 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as app_module  # noqa: E402
+import stub_backends  # noqa: E402
+
+# Rendimiento de /upload con subidas concurrentes, en modo síncrono y
+# asíncrono, usando backends locales con latencia simulada.
+
+
+def upload(client, wav_bytes, name):
+    data = {'file': (io.BytesIO(wav_bytes), name)}
+    return client.post('/upload', data=data, content_type='multipart/form-data',
+                       headers={'Accept': 'application/json'})
+
+
+def wait_for_job(client, job_id):
+    while True:
+        status = client.get(f'/status/{job_id}').get_json()
+        if status['status'] in ('done', 'error'):
+            return status
+        time.sleep(0.01)
+
+
+def run(mode, num_clients, uploads_per_client, wav_bytes):
+    app = app_module.app
+    app.config['ASYNC_UPLOADS'] = mode == 'async'
+    request_latencies = []
+    lock = threading.Lock()
+
+    def client_loop(client_id):
+        client = app.test_client()
+        job_ids = []
+        for i in range(uploads_per_client):
+            start = time.perf_counter()
+            response = upload(client, stub_backends.make_unique(wav_bytes, client_id * uploads_per_client + i),
+                              f'c{client_id}_{i}.wav')
+            with lock:
+                request_latencies.append(time.perf_counter() - start)
+            if mode == 'async':
+                job_ids.append(response.get_json()['job_id'])
+        for job_id in job_ids:
+            wait_for_job(client, job_id)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client_loop, args=(c,)) for c in range(num_clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = num_clients * uploads_per_client
+    request_latencies.sort()
+    p50 = request_latencies[len(request_latencies) // 2] * 1000
+    print(f"{mode:>6}: {total} subidas en {elapsed:.2f} s -> {total / elapsed:.1f} subidas/s, "
+          f"latencia de /upload p50 {p50:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--uploads', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--delay', type=float, default=0.2, help='latencia simulada de cada servicio externo')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as upload_folder:
+        app_module.app.config['UPLOAD_FOLDER'] = upload_folder
+        app_module.app.config['TRANSLATION_CACHE_PATH'] = os.path.join(upload_folder, 'translation_cache.sqlite3')
+        stub_backends.install(app_module.app, recognizer_delay=args.delay, translator_delay=args.delay)
+        wav_bytes = stub_backends.make_wav(args.seconds)
+        for mode in ('sync', 'async'):
+            run(mode, args.clients, args.uploads, wav_bytes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import speech_recognition as sr  # noqa: E402
+
+import stub_backends  # noqa: E402
+from transcription import split_audio, transcribe_chunked  # noqa: E402
+
+# Transcripción completa vs por fragmentos con un reconocedor local cuya
+# latencia crece con la duración del audio.
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, nargs='+', default=[30, 120, 300])
+    parser.add_argument('--chunk-seconds', type=float, default=30)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--delay-per-second', type=float, default=0.005)
+    args = parser.parse_args()
+
+    recognizer = stub_backends.StubRecognizer()
+    recognizer.delay = 0.05
+    recognizer.delay_per_second = args.delay_per_second
+
+    def recognize(audio):
+        return recognizer.recognize_google(audio)
+
+    print(f"{'audio (s)':>9} {'modo':>7} {'fragmentos':>10} {'completo (s)':>12} {'fragmentos (s)':>14}")
+    for seconds in args.seconds:
+        audio = sr.AudioData(stub_backends.make_wav(seconds)[44:], 16000, 2)
+        start = time.perf_counter()
+        recognize(audio)
+        whole = time.perf_counter() - start
+        for mode in ('silence', 'fixed'):
+            overlap = 1.0 if mode == 'fixed' else 0.0
+            chunks = len(split_audio(audio, args.chunk_seconds, overlap, mode))
+            start = time.perf_counter()
+            transcribe_chunked(audio, recognize, chunk_seconds=args.chunk_seconds, overlap_seconds=overlap,
+                               mode=mode, max_workers=args.workers)
+            chunked = time.perf_counter() - start
+            print(f"{seconds:>9.0f} {mode:>7} {chunks:>10} {whole:>12.2f} {chunked:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
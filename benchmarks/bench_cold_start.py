@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Arranque en frío: cada repetición lanza un intérprete nuevo (como un worker
+# recién reciclado) y mide:
+#   - el tiempo de importar la aplicación;
+#   - la primera petición GET /;
+#   - la primera subida a /upload (con reconocedor y traductor locales), que
+#     paga las importaciones y compilaciones diferidas;
+#   - una segunda subida, ya en caliente, como referencia.
+#
+# Uso:
+#   python benchmarks/bench_cold_start.py --runs 10
+
+CHILD = r"""
+import io, json, os, sys, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {bench_dir!r})
+result = {{}}
+start = time.perf_counter()
+import app as app_module
+result["import"] = time.perf_counter() - start
+heavy = ["speech_recognition", "googletrans", "httpx"]
+result["loaded_after_import"] = [name for name in heavy if name in sys.modules]
+
+import stub_backends
+application = app_module.create_app() if hasattr(app_module, "create_app") else app_module.app
+application.config["ASYNC_UPLOADS"] = False
+stub_backends.install(application)
+client = application.test_client()
+
+start = time.perf_counter()
+client.get("/")
+result["first_get"] = time.perf_counter() - start
+
+wav = stub_backends.make_wav(5)
+sys.stdout = open(os.devnull, "w")
+for key, n in (("first_upload", 1), ("warm_upload", 2)):
+    start = time.perf_counter()
+    response = client.post("/upload", data={{"file": (io.BytesIO(stub_backends.make_unique(wav, n)), "a.wav")}},
+                           content_type="multipart/form-data")
+    result[key] = time.perf_counter() - start
+    assert response.status_code == 200, response.status_code
+sys.stdout = sys.__stdout__
+print(json.dumps(result))
+"""
+
+STAGES = ["import", "first_get", "first_upload", "warm_upload"]
+
+
+def run_child(tmp_dir):
+    # Con la caché del índice de sinónimos activada, como en un despliegue
+    env = dict(os.environ, TRANSLATION_CACHE_PATH="",
+               SYNONYMS_CACHE_PATH=os.path.join(tmp_dir, "synonyms_index.pickle"))
+    code = CHILD.format(root=ROOT, bench_dir=BENCH_DIR)
+    output = subprocess.run([sys.executable, "-W", "ignore", "-c", code], cwd=tmp_dir, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = {stage: [] for stage in STAGES}
+    loaded = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_child(tmp_dir)  # Calentar la caché de bytecode y los archivos precompilados
+        for _ in range(args.runs):
+            result = run_child(tmp_dir)
+            loaded = result["loaded_after_import"]
+            for stage in STAGES:
+                samples[stage].append(result[stage])
+
+    print(f"{'etapa':<14} {'mediana (ms)':>13} {'mín (ms)':>9} {'máx (ms)':>9}")
+    for stage in STAGES:
+        values = samples[stage]
+        print(f"{stage:<14} {statistics.median(values) * 1000:>13.1f} "
+              f"{min(values) * 1000:>9.1f} {max(values) * 1000:>9.1f}")
+    print(f"\nMódulos pesados cargados tras importar app: {', '.join(loaded) or 'ninguno'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from diff_engine import diff_words  # noqa: E402
+
+# Motor de diferencias propio vs el camino anterior con SequenceMatcher,
+# sobre transcripciones de 10k palabras con distintas tasas de edición. La
+# columna "previstas" es el número de ediciones introducidas (una por palabra
+# borrada, sustituida o insertada) y sirve de referencia para los cambios
+# contados; con tasas altas la diferencia mínima puede agrupar las ediciones
+# de otra forma y contar algunos más.
+
+BASE_WORDS = ("the a is are I you we they it my your this that and but so to of in on at "
+              "go went like want need have has do does can will would school house friend "
+              "teacher student family city day night time work play read write speak").split()
+
+
+def make_vocabulary(size):
+    # Vocabulario con frecuencias de tipo Zipf, como en el habla real
+    words = BASE_WORDS + [f"word{i}" for i in range(size - len(BASE_WORDS))]
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def legacy_count(words1, words2):
+    # Bucle anterior sobre los opcodes de SequenceMatcher (sin sinónimos)
+    num_differences = 0
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, words1, words2).get_opcodes():
+        if tag == 'replace':
+            for i in range(i1, i2):
+                if j1 < len(words2):
+                    if words1[i] != words2[j1]:
+                        num_differences += 1
+                    j1 += 1
+        elif tag == 'delete':
+            num_differences += i2 - i1
+        elif tag == 'insert':
+            num_differences += j2 - j1
+    return num_differences
+
+
+def mutate(words, rate, rng, vocabulary):
+    # Devuelve (palabras editadas, número de ediciones introducidas)
+    result = []
+    edits = 0
+    for word in words:
+        r = rng.random()
+        if r < rate / 3:
+            edits += 1
+            continue  # borrado
+        elif r < 2 * rate / 3:
+            result.append(rng.choice(vocabulary))  # sustitución
+            edits += 1
+        elif r < rate:
+            result.extend([word, rng.choice(vocabulary)])  # inserción
+            edits += 1
+        else:
+            result.append(word)
+    return result, edits
+
+
+def main():
+    rng = random.Random(0)
+    num_words = 10000
+    print(f"{'vocab':>6} {'edición':>8} {'previstas':>10} {'SequenceMatcher (s)':>20} {'cambios':>8} "
+          f"{'Myers (s)':>10} {'cambios':>8}")
+    for vocabulary_size, rate in [(60, 0.05), (2000, 0.01), (2000, 0.05), (2000, 0.2), (2000, 0.5)]:
+        words, weights = make_vocabulary(vocabulary_size)
+        words1 = rng.choices(words, weights, k=num_words)
+        words2, planted = mutate(words1, rate, rng, words)
+
+        start = time.perf_counter()
+        legacy = legacy_count(words1, words2)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changes = diff_words(words1, words2)
+        engine_time = time.perf_counter() - start
+
+        print(f"{vocabulary_size:>6} {rate:>8.0%} {planted:>10} {legacy_time:>20.3f} {legacy:>8} "
+              f"{engine_time:>10.3f} {len(changes):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stub_backends  # noqa: E402
+
+# Benchmark de extremo a extremo de /upload sin conexión:
+#   - genera WAV sintéticos de distintas duraciones y frecuencias de muestreo;
+#   - sustituye recognize_google y googletrans.Translator por versiones locales;
+#   - recorre la aplicación con el cliente de pruebas de Flask, en serie y con
+#     varios clientes concurrentes;
+#   - lee los tiempos de cada etapa de la cabecera Server-Timing y muestra
+#     p50/p95/p99 por etapa y el rendimiento total;
+#   - compara con benchmarks/e2e_baseline.json y termina con error si alguna
+#     etapa empeora más allá de la tolerancia.
+#
+# Uso:
+#   python benchmarks/bench_e2e.py                    # comparar con la referencia
+#   python benchmarks/bench_e2e.py --update-baseline  # guardar una nueva referencia
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "e2e_baseline.json")
+
+# (nombre, segundos, frecuencia de muestreo, canales)
+SCENARIOS = [
+    ("5s_16k_mono", 5, 16000, 1),
+    ("30s_16k_mono", 30, 16000, 1),
+    ("30s_44k_stereo", 30, 44100, 2),
+    ("120s_16k_mono", 120, 16000, 1),
+]
+CONCURRENT_SCENARIO = "30s_16k_mono"
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def parse_server_timing(header):
+    timings = {}
+    for part in header.split(","):
+        name, _, rest = part.strip().partition(";dur=")
+        if name and rest:
+            timings[name] = float(rest) / 1000.0
+    return timings
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, stage, seconds):
+        with self._lock:
+            self.samples.setdefault(key, {}).setdefault(stage, []).append(seconds)
+
+    def summary(self):
+        result = {}
+        for key, stages in self.samples.items():
+            result[key] = {
+                stage: {"p50": percentile(values, 50), "p95": percentile(values, 95),
+                        "p99": percentile(values, 99), "n": len(values)}
+                for stage, values in stages.items()
+            }
+        return result
+
+
+def upload(client, wav_bytes, recorder, key):
+    response = client.post('/upload', data={'file': (io.BytesIO(wav_bytes), 'bench.wav')},
+                           content_type='multipart/form-data')
+    if response.status_code != 200:
+        raise RuntimeError(f"/upload devolvió {response.status_code}")
+    for stage, seconds in parse_server_timing(response.headers.get('Server-Timing', '')).items():
+        recorder.add(key, stage, seconds)
+
+
+def run_sequential(app, wavs, iterations, recorder, counter):
+    client = app.test_client()
+    throughput = {}
+    for name, wav_bytes in wavs.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            upload(client, stub_backends.make_unique(wav_bytes, next(counter)), recorder, f"seq/{name}")
+        throughput[f"seq/{name}"] = iterations / (time.perf_counter() - start)
+    return throughput
+
+
+def run_concurrent(app, wav_bytes, clients, uploads_per_client, recorder, counter):
+    lock = threading.Lock()
+    errors = []
+
+    def client_loop():
+        client = app.test_client()
+        for _ in range(uploads_per_client):
+            with lock:
+                n = next(counter)
+            try:
+                upload(client, stub_backends.make_unique(wav_bytes, n), recorder, "concurrent")
+            except Exception as e:
+                errors.append(e)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client_loop) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return {"concurrent": clients * uploads_per_client / (time.perf_counter() - start)}
+
+
+def compare(results, baseline, tolerance, min_slack):
+    # Una etapa empeora si su p95 supera la referencia * (1 + tolerancia) + holgura;
+    # el rendimiento empeora si baja de la referencia * (1 - tolerancia)
+    regressions = []
+    for key, stages in baseline.get("stages", {}).items():
+        for stage, reference in stages.items():
+            current = results["stages"].get(key, {}).get(stage)
+            if current is None:
+                continue
+            limit = reference["p95"] * (1 + tolerance) + min_slack
+            if current["p95"] > limit:
+                regressions.append(f"{key} {stage}: p95 {current['p95'] * 1000:.1f} ms "
+                                   f"> {limit * 1000:.1f} ms (referencia {reference['p95'] * 1000:.1f} ms)")
+    for key, reference in baseline.get("throughput", {}).items():
+        current = results["throughput"].get(key)
+        if current is not None and current < reference * (1 - tolerance):
+            regressions.append(f"{key}: {current:.1f} subidas/s < {reference * (1 - tolerance):.1f} "
+                               f"(referencia {reference:.1f})")
+    return regressions
+
+
+def print_results(results):
+    for key, stages in sorted(results["stages"].items()):
+        print(f"\n{key}")
+        print(f"  {'etapa':<14} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'n':>4}")
+        for stage, values in stages.items():
+            print(f"  {stage:<14} {values['p50'] * 1000:>9.1f} {values['p95'] * 1000:>9.1f} "
+                  f"{values['p99'] * 1000:>9.1f} {values['n']:>4}")
+    print("\nRendimiento (subidas/s)")
+    for key, value in sorted(results["throughput"].items()):
+        print(f"  {key:<24} {value:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=10, help='subidas en serie por escenario')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--uploads-per-client', type=int, default=5)
+    parser.add_argument('--service-delay', type=float, default=0.0,
+                        help='latencia simulada de cada llamada a un servicio externo (s)')
+    parser.add_argument('--tolerance', type=float, default=0.5)
+    parser.add_argument('--min-slack', type=float, default=0.005,
+                        help='holgura absoluta por etapa (s), evita falsos positivos en etapas muy rápidas')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # La configuración se fija antes de crear los servicios de la aplicación
+        os.environ['TRANSLATION_CACHE_PATH'] = ''
+        os.environ['TRANSLATION_CACHE_MEMORY_ENTRIES'] = '0'
+        import app as app_module
+
+        app = app_module.app
+        app.config['UPLOAD_FOLDER'] = tmp_dir
+        app.config['ASYNC_UPLOADS'] = False
+        stub_backends.install(app, recognizer_delay=args.service_delay, translator_delay=args.service_delay)
+
+        # Silenciar los print del pipeline durante la medición
+        devnull = open(os.devnull, 'w')
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            wavs = {name: stub_backends.make_wav(seconds, sample_rate, channels)
+                    for name, seconds, sample_rate, channels in SCENARIOS}
+            recorder = Recorder()
+            counter = iter(range(10 ** 9))
+            # Una subida sin medir paga las importaciones y compilaciones diferidas
+            # del arranque (medidas aparte en bench_cold_start.py)
+            upload(app.test_client(), stub_backends.make_unique(wavs[SCENARIOS[0][0]], next(counter)),
+                   Recorder(), "warmup")
+            throughput = run_sequential(app, wavs, args.iterations, recorder, counter)
+            throughput.update(run_concurrent(app, wavs[CONCURRENT_SCENARIO], args.clients,
+                                             args.uploads_per_client, recorder, counter))
+        finally:
+            sys.stdout = stdout
+            devnull.close()
+
+    results = {"stages": recorder.summary(), "throughput": throughput}
+    print_results(results)
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print(f"\nReferencia guardada en {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\nNo hay referencia guardada; ejecuta con --update-baseline")
+        return 0
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance, args.min_slack)
+    if regressions:
+        print("\nREGRESIONES:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    print("\nSin regresiones respecto a la referencia")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
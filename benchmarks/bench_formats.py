@@ -0,0 +1,95 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stub_backends  # noqa: E402
+from audio_probe import load_audio, ffmpeg_available  # noqa: E402
+
+# Coste de cada formato de subida: bytes subidos, tiempo de decodificación y
+# normalización a 16 kHz mono (load_audio, la etapa "decode" del pipeline) y
+# tamaño de lo que se envía al reconocedor (el FLAC que genera
+# recognize_google). La referencia es el comportamiento anterior: un WAV de
+# 44.1 kHz estéreo decodificado sin normalizar. Los formatos comprimidos se
+# generan con ffmpeg a partir del mismo audio sintético; sin ffmpeg solo se
+# miden los WAV.
+#
+# Uso:
+#   python benchmarks/bench_formats.py --seconds 30 --runs 5
+
+# (nombre, extensión, argumentos de ffmpeg para codificar)
+ENCODINGS = [
+    ("mp3 64k", ".mp3", ["-c:a", "libmp3lame", "-b:a", "64k"]),
+    ("m4a aac 64k", ".m4a", ["-c:a", "aac", "-b:a", "64k"]),
+    ("ogg vorbis", ".ogg", ["-c:a", "libvorbis", "-q:a", "2"]),
+    ("webm opus 32k", ".webm", ["-c:a", "libopus", "-b:a", "32k"]),
+    ("flac", ".flac", ["-c:a", "flac"]),
+]
+
+
+def encode(ffmpeg, source, target, codec_args):
+    subprocess.run([ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-y", "-i", source]
+                   + codec_args + [target], check=True)
+
+
+def measure(path, runs, sample_rate, ffmpeg):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        audio = load_audio(path, sample_rate, ffmpeg)
+        times.append(time.perf_counter() - start)
+    # recognize_google envía FLAC de 16 bits a la frecuencia del AudioData
+    payload = len(audio.get_flac_data(convert_width=2))
+    return {"upload": os.path.getsize(path), "decode": statistics.median(times),
+            "pcm": len(audio.frame_data), "payload": payload}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=30, help="duración del audio sintético")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ffmpeg", default="ffmpeg")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "source.wav")
+        with open(source, "wb") as f:
+            f.write(stub_backends.make_wav(args.seconds, sample_rate=44100, channels=2))
+        mono = os.path.join(tmp_dir, "mono16k.wav")
+        with open(mono, "wb") as f:
+            f.write(stub_backends.make_wav(args.seconds, sample_rate=16000, channels=1))
+
+        load_audio(source, None)  # Calentamiento: importar speech_recognition
+        rows.append(("wav 44.1k estéreo (antes)", measure(source, args.runs, None, None)))
+        rows.append(("wav 44.1k estéreo", measure(source, args.runs, 16000, args.ffmpeg)))
+        rows.append(("wav 16k mono", measure(mono, args.runs, 16000, args.ffmpeg)))
+
+        if ffmpeg_available(args.ffmpeg):
+            for name, extension, codec_args in ENCODINGS:
+                target = os.path.join(tmp_dir, "encoded" + extension)
+                encode(args.ffmpeg, source, target, codec_args)
+                rows.append((name, measure(target, args.runs, 16000, args.ffmpeg)))
+        else:
+            print(f"ffmpeg no encontrado ({args.ffmpeg}): solo se miden los WAV\n")
+
+    reference = rows[0][1]
+    print(f"Audio de {args.seconds:g} s; decodificación: mediana de {args.runs}; todo normalizado "
+          f"a 16 kHz mono salvo la referencia\n")
+    print(f"{'formato':<26} {'subida (KB)':>12} {'vs ref':>7} {'decodificar (ms)':>17} "
+          f"{'PCM (KB)':>9} {'al reconocedor (KB)':>20} {'vs ref':>7}")
+    for name, row in rows:
+        print(f"{name:<26} {row['upload'] / 1024:>12.0f} {row['upload'] / reference['upload']:>7.2f} "
+              f"{row['decode'] * 1000:>17.1f} {row['pcm'] / 1024:>9.0f} {row['payload'] / 1024:>20.0f} "
+              f"{row['payload'] / reference['payload']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import json
+import os
+import random
+import re
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import punctuation  # noqa: E402
+from punctuation import add_question_marks, pronouns_combinations, question_words_combinations  # noqa: E402
+
+# Verifica add_question_marks contra el corpus de salidas esperadas
+# (generado con la implementación original) y compara tiempos con la
+# versión original, que reconstruía y recompilaba los patrones en cada llamada.
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "punctuation_golden.json")
+
+
+def legacy_add_question_marks(text):
+    # Implementación original: patrones construidos en cada llamada
+    pronouns_pattern = "|".join([f"\\b{pronoun} ({'|'.join(combinations)})" for pronoun, combinations in pronouns_combinations])
+    question_words_pattern = "|".join([pair[0] for pair in question_words_combinations])
+
+    match = re.search(rf"({question_words_pattern})(.*?)(\b{pronouns_pattern}\b)", text)
+    if match:
+        question_mark_position = match.start(3) - 1
+        return text[:question_mark_position] + "?" + text[question_mark_position:]
+    question_match = re.search(rf"({question_words_pattern})\b(.*)", text)
+    if question_match:
+        if not re.search(pronouns_pattern, question_match.group(2).strip()):
+            text = text + "?"
+        else:
+            return text
+
+    for pronoun, combinations in pronouns_combinations:
+        for combination in combinations:
+            text = re.sub(rf"(\b{pronoun} {combination}\b)(?!\?)", r". \1", text)
+
+    text = re.sub(rf"(?<!\.)\s*(?=\b{question_words_pattern}\b)", ".", text)
+    text = re.sub(r"\.\.+", ".", text)
+    text = re.sub(r"(\.)(?=\S)", r". ", text)
+    text = re.sub(r"\s+\.", ".", text)
+    return text.lstrip(".").lstrip()
+
+
+def check_golden():
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        golden = json.load(f)
+    failures = [case for case in golden if add_question_marks(case["input"]) != case["output"]]
+    for case in failures[:5]:
+        print("DIFERENCIA:", repr(case["input"]))
+        print("  esperado:", repr(case["output"]))
+        print("  obtenido:", repr(add_question_marks(case["input"])))
+    print(f"Corpus: {len(golden) - len(failures)}/{len(golden)} casos idénticos")
+    return not failures
+
+
+def main():
+    if not check_golden():
+        sys.exit(1)
+
+    rng = random.Random(0)
+    # Vocabulario sin palabras de pregunta (ni como subcadena), para recorrer
+    # siempre la fase de puntos
+    question_words = [pair[0] for pair in question_words_combinations]
+    vocabulary = sorted(
+        word
+        for word in {w for pair in pronouns_combinations for w in [pair[0]] + pair[1][:20]}
+        if not any(question_word in word for question_word in question_words)
+    )
+    print(f"Reglas de punto: {sum(len(rules) for _, rules in punctuation._period_rules)}")
+    print(f"{'palabras':>9} {'original (ms)':>14} {'compilado (ms)':>15} {'speedup':>8}")
+    for num_words in (10, 50, 200, 1000):
+        text = " ".join(rng.choice(vocabulary) for _ in range(num_words))
+        legacy = min(timeit.repeat(lambda: legacy_add_question_marks(text), number=1, repeat=3)) * 1000
+        fast = min(timeit.repeat(lambda: add_question_marks(text), number=1, repeat=3)) * 1000
+        print(f"{num_words:>9} {legacy:>14.2f} {fast:>15.2f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
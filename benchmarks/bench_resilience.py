@@ -0,0 +1,158 @@
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stub_backends  # noqa: E402
+
+# Latencia de cola y tasa de error de /upload cuando los servicios externos
+# fallan. Las subidas llegan a ritmo fijo (sin esperar a que terminen las
+# anteriores, como usuarios independientes) contra servicios locales con
+# fallos inyectados (lentitud, errores, caída temporal) y se compara la
+# aplicación sin protección (sin tiempo máximo, sin reintentos, sin circuito)
+# con la política de resilience.py. Los tiempos de la política están escalados
+# a las latencias simuladas, manteniendo la proporción de los valores por
+# defecto (la espera en cola es menor que el tiempo que el circuito pasa abierto);
+# con la política, los clientes simulados tienen además su propio tiempo máximo,
+# como _default_recognizer y _default_translator.
+#
+# Uso:
+#   python benchmarks/bench_resilience.py --rate 20 --uploads 60
+
+SCENARIOS = {
+    'sano': {},
+    'lento': {'slow_rate': 0.1, 'slow_delay': 2.0},
+    'errores': {'failure_rate': 0.2},
+    'caída': {'outage': (0.5, 2.0), 'outage_delay': 3.0},
+}
+
+UNPROTECTED = {
+    'RECOGNIZER_CONCURRENCY': 1000, 'TRANSLATOR_CONCURRENCY': 1000, 'TRANSLATOR_POOL_SIZE': 1000,
+    'RECOGNIZER_TIMEOUT': None, 'TRANSLATOR_TIMEOUT': None,
+    'BACKEND_RETRIES': 0, 'BACKEND_QUEUE_SIZE': 1000, 'BACKEND_QUEUE_TIMEOUT': 3600,
+    'BREAKER_FAILURE_THRESHOLD': 10 ** 9, 'BREAKER_RESET_TIMEOUT': 0,
+}
+
+PROTECTED = {
+    'RECOGNIZER_CONCURRENCY': 16, 'TRANSLATOR_CONCURRENCY': 16, 'TRANSLATOR_POOL_SIZE': 16,
+    'RECOGNIZER_TIMEOUT': 0.5, 'TRANSLATOR_TIMEOUT': 0.3,
+    'BACKEND_RETRIES': 2, 'BACKEND_BACKOFF_BASE': 0.05, 'BACKEND_BACKOFF_MAX': 0.4,
+    'BACKEND_QUEUE_SIZE': 32, 'BACKEND_QUEUE_TIMEOUT': 0.3,
+    'BREAKER_FAILURE_THRESHOLD': 5, 'BREAKER_RESET_TIMEOUT': 1.0,
+}
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100.0 * (len(values) - 1))))]
+
+
+def run_scenario(app_module, app, wav_bytes, policy, faults, args, offset):
+    app.config.update(policy)
+    # Cada escenario empieza con los circuitos cerrados y los contadores a cero
+    with app_module._backends_lock:
+        app_module._backends.clear()
+    recognizer_faults = stub_backends.FaultInjector(client_timeout=policy['RECOGNIZER_TIMEOUT'],
+                                                    seed=args.seed, **faults)
+    translator_faults = stub_backends.FaultInjector(client_timeout=policy['TRANSLATOR_TIMEOUT'],
+                                                    seed=args.seed + 1, **faults)
+    stub_backends.install(app, recognizer_delay=args.recognizer_delay, translator_delay=args.translator_delay,
+                          recognizer_faults=recognizer_faults, translator_faults=translator_faults)
+    app_module.get_translation_service()
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def upload(n):
+        data = stub_backends.make_unique(wav_bytes, offset + n)
+        start = time.perf_counter()
+        response = app.test_client().post('/upload', data={'file': (io.BytesIO(data), 'bench.wav')},
+                                          content_type='multipart/form-data')
+        elapsed = time.perf_counter() - start
+        failed = response.status_code != 200 or \
+            app_module.REQUEST_ERROR_MESSAGE in response.get_data(as_text=True)
+        with lock:
+            latencies.append(elapsed)
+            errors[0] += failed
+
+    # Llegadas a ritmo fijo: cada subida en su propio hilo
+    threads = []
+    start = time.perf_counter()
+    for n in range(args.uploads):
+        time.sleep(max(0.0, start + n / args.rate - time.perf_counter()))
+        thread = threading.Thread(target=upload, args=(n,))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    return latencies, errors[0], wall, app_module.backend_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rate', type=float, default=20, help='subidas por segundo')
+    parser.add_argument('--uploads', type=int, default=60, help='subidas por escenario y política')
+    parser.add_argument('--seconds', type=float, default=3, help='duración del audio sintético')
+    parser.add_argument('--recognizer-delay', type=float, default=0.05)
+    parser.add_argument('--translator-delay', type=float, default=0.02)
+    parser.add_argument('--seed', type=int, default=1, help='semilla de los fallos simulados')
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    args = parser.parse_args()
+
+    os.environ['TRANSLATION_CACHE_PATH'] = ''
+    os.environ['TRANSLATION_CACHE_MEMORY_ENTRIES'] = '0'
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = app_module.create_app({'UPLOAD_FOLDER': tmp_dir, 'ASYNC_UPLOADS': False,
+                                     'STREAM_RESULTS': False})
+        # Los errores simulados no deben llenar la salida de trazas
+        app.logger.disabled = True
+        wav_bytes = stub_backends.make_wav(args.seconds)
+
+        devnull = open(os.devnull, 'w')
+        stdout = sys.stdout
+        sys.stdout = devnull
+        rows = []
+        try:
+            offset = 0
+            for scenario in args.scenarios:
+                for policy_name, policy in (('sin protección', UNPROTECTED), ('resiliencia', PROTECTED)):
+                    result = run_scenario(app_module, app, wav_bytes, policy, SCENARIOS[scenario], args, offset)
+                    offset += args.uploads
+                    rows.append((scenario, policy_name) + result)
+        finally:
+            sys.stdout = stdout
+            devnull.close()
+
+    print(f"{args.uploads} subidas a {args.rate:g}/s por escenario; reconocedor "
+          f"{args.recognizer_delay:g} s, traductor {args.translator_delay:g} s por llamada\n")
+    print(f"{'escenario':<10} {'política':<15} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'errores':>8} {'total (s)':>10}")
+    for scenario, policy_name, latencies, errors, wall, _ in rows:
+        print(f"{scenario:<10} {policy_name:<15} {statistics.median(latencies) * 1000:>9.0f} "
+              f"{percentile(latencies, 95) * 1000:>9.0f} {percentile(latencies, 99) * 1000:>9.0f} "
+              f"{errors / len(latencies):>8.0%} {wall:>10.2f}")
+
+    print("\nServicios externos con la política de resiliencia")
+    for scenario, policy_name, _, _, _, stats in rows:
+        if policy_name != 'resiliencia':
+            continue
+        for backend_name, values in sorted(stats.items()):
+            print(f"  {scenario:<10} {backend_name:<11} reintentos={values['retries']} "
+                  f"tiempo agotado={values['timeouts']} rechazadas={values['rejected']} "
+                  f"circuito={values['state']}")
+
+
+if __name__ == '__main__':
+    main()
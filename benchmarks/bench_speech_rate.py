@@ -0,0 +1,80 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from speech_rate import analyze_wav  # noqa: E402
+
+# Escalado del análisis de voz y pausas con la duración del audio: se escriben
+# WAV sintéticos de hasta una hora (por bloques, sin tenerlos en memoria) y se
+# mide el tiempo y la memoria máxima de analyze_wav. El tiempo por segundo de
+# audio debe mantenerse constante (escalado lineal) y la memoria casi plana.
+#
+# Uso:
+#   python benchmarks/bench_speech_rate.py --minutes 1 5 15 30 60
+
+
+def pattern(sample_rate, rng):
+    # 10 s de "habla": ráfagas de tono de 0.2-0.6 s separadas por huecos cortos
+    # y una pausa larga, sobre ruido de fondo
+    t = np.arange(int(0.6 * sample_rate)) / sample_rate
+    parts = []
+    for _ in range(12):
+        length = int(rng.uniform(0.2, 0.6) * sample_rate)
+        parts.append(0.3 * np.sin(2 * np.pi * rng.uniform(120, 300) * t[:length]))
+        parts.append(np.zeros(int(rng.uniform(0.05, 0.15) * sample_rate)))
+    parts.append(np.zeros(int(1.0 * sample_rate)))
+    signal = np.concatenate(parts)[:10 * sample_rate]
+    signal = np.pad(signal, (0, 10 * sample_rate - len(signal)))
+    signal += 0.001 * rng.standard_normal(len(signal))
+    return (signal * 32767).astype("<i2").tobytes()
+
+
+def write_wav(path, minutes, sample_rate, block):
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        for _ in range(int(minutes * 6)):
+            wav.writeframes(block)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 5, 15, 30, 60])
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    args = parser.parse_args()
+
+    block = pattern(args.sample_rate, np.random.default_rng(0))
+    print(f"{'minutos':>8} {'tiempo (s)':>11} {'µs/s audio':>11} {'memoria máx (MB)':>17} {'pausas':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Calentamiento: la primera llamada paga la importación de NumPy
+        warmup = os.path.join(tmp_dir, "warmup.wav")
+        write_wav(warmup, 1 / 6, args.sample_rate, block)
+        analyze_wav(warmup)
+
+        for minutes in args.minutes:
+            path = os.path.join(tmp_dir, f"{minutes:g}min.wav")
+            write_wav(path, minutes, args.sample_rate, block)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            analysis = analyze_wav(path)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            os.remove(path)
+
+            print(f"{minutes:>8g} {elapsed:>11.3f} {elapsed / analysis.duration * 1e6:>11.1f} "
+                  f"{peak / 1024 ** 2:>17.1f} {analysis.pause_count:>7}")
+
+
+if __name__ == "__main__":
+    main()
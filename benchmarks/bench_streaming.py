@@ -0,0 +1,107 @@
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stub_backends  # noqa: E402
+
+# Tiempo hasta el primer contenido: modo síncrono (result.html al terminar todo
+# el pipeline) frente a modo streaming (la página se abre enseguida y cada
+# etapa llega por /events/<hash>). Los servicios externos son locales, con
+# latencias simuladas.
+#
+# Uso:
+#   python benchmarks/bench_streaming.py --recognizer-delay 1.0 --translator-delay 0.5
+
+
+def post_upload(client, wav_bytes):
+    return client.post('/upload', data={'file': (io.BytesIO(wav_bytes), 'bench.wav')},
+                       content_type='multipart/form-data')
+
+
+def run_sync(app, wav_bytes):
+    app.config['STREAM_RESULTS'] = False
+    start = time.perf_counter()
+    response = post_upload(app.test_client(), wav_bytes)
+    assert response.status_code == 200, response.status_code
+    total = time.perf_counter() - start
+    # La página solo se ve cuando el pipeline ha terminado
+    return {'page': total, 'first_content': total, 'complete': total}
+
+
+def run_stream(app, wav_bytes):
+    app.config['STREAM_RESULTS'] = True
+    client = app.test_client()
+    start = time.perf_counter()
+    response = post_upload(client, wav_bytes)
+    assert response.status_code == 200, response.status_code
+    page = time.perf_counter() - start
+    content_hash = response.get_data(as_text=True).split('/events/', 1)[1][:64]
+
+    timings = {'page': page}
+    events = client.get(f'/events/{content_hash}', buffered=False)
+    for chunk in events.response:
+        chunk = chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+        if chunk.startswith('event: '):
+            stage = chunk[len('event: '):].split('\n', 1)[0]
+            timings[stage] = time.perf_counter() - start
+    events.close()
+    timings['first_content'] = timings['transcription']
+    timings['complete'] = timings['done']
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--seconds', type=float, default=30, help='duración del audio sintético')
+    parser.add_argument('--recognizer-delay', type=float, default=1.0)
+    parser.add_argument('--translator-delay', type=float, default=0.5)
+    args = parser.parse_args()
+
+    os.environ['TRANSLATION_CACHE_PATH'] = ''
+    os.environ['TRANSLATION_CACHE_MEMORY_ENTRIES'] = '0'
+    import app as app_module
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = app_module.create_app({'UPLOAD_FOLDER': tmp_dir, 'ASYNC_UPLOADS': False})
+        stub_backends.install(app, recognizer_delay=args.recognizer_delay,
+                              translator_delay=args.translator_delay)
+        wav_bytes = stub_backends.make_wav(args.seconds)
+
+        # Silenciar los print del pipeline durante la medición
+        devnull = open(os.devnull, 'w')
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            run_sync(app, stub_backends.make_unique(wav_bytes, 0))  # Calentamiento
+            results = {'sync': [], 'stream': []}
+            for n in range(args.runs):
+                results['sync'].append(run_sync(app, stub_backends.make_unique(wav_bytes, 2 * n + 1)))
+                results['stream'].append(run_stream(app, stub_backends.make_unique(wav_bytes, 2 * n + 2)))
+        finally:
+            sys.stdout = stdout
+            devnull.close()
+
+    print(f"Audio de {args.seconds:g} s, reconocedor {args.recognizer_delay:g} s, "
+          f"traductor {args.translator_delay:g} s por llamada; medianas de {args.runs} subidas\n")
+    print(f"{'modo':<8} {'página (ms)':>12} {'1er contenido (ms)':>19} {'completo (ms)':>14}")
+    for mode, runs in results.items():
+        print(f"{mode:<8} {statistics.median(r['page'] for r in runs) * 1000:>12.1f} "
+              f"{statistics.median(r['first_content'] for r in runs) * 1000:>19.1f} "
+              f"{statistics.median(r['complete'] for r in runs) * 1000:>14.1f}")
+
+    print("\nStreaming, llegada de cada etapa (ms desde el envío)")
+    for stage in ['transcription', 'spanish', 'english', 'difference', 'fluency', 'done']:
+        print(f"  {stage:<14} {statistics.median(r[stage] for r in results['stream']) * 1000:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
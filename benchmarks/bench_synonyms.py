@@ -0,0 +1,70 @@
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synonyms import SynonymIndex  # noqa: E402
+
+# Benchmark: reemplazo secuencial original vs índice precompilado,
+# a medida que el diccionario crece hasta miles de entradas.
+
+
+def legacy_replace_synonyms(text, synonyms_dict):
+    # Implementación original (text.replace por cada sinónimo de cada clave)
+    for key, synonyms in synonyms_dict.items():
+        for synonym in synonyms:
+            text = text.replace(synonym, key)
+    return text
+
+
+def legacy_are_synonyms(word1, word2, synonyms_dict):
+    return (word1 in synonyms_dict and word2 in synonyms_dict[word1]) or \
+        (word2 in synonyms_dict and word1 in synonyms_dict[word2])
+
+
+def make_dict(num_keys, rng):
+    synonyms_dict = {}
+    for k in range(num_keys):
+        synonyms_dict[f"key{k}"] = [f"syn{k}x{s}" for s in range(5)]
+    return synonyms_dict
+
+
+def make_text(synonyms_dict, num_words, rng):
+    vocabulary = [s for synonyms in synonyms_dict.values() for s in synonyms]
+    vocabulary += [f"word{i}" for i in range(200)]
+    return " ".join(rng.choice(vocabulary) for _ in range(num_words))
+
+
+def main():
+    rng = random.Random(0)
+    num_words = 500
+    print(f"{'claves':>8} {'legacy (ms)':>12} {'build (ms)':>11} {'index (ms)':>11} {'speedup':>8}")
+    for num_keys in (10, 100, 1000, 5000):
+        synonyms_dict = make_dict(num_keys, rng)
+        text = make_text(synonyms_dict, num_words, rng)
+        words = text.split()
+        pairs = list(zip(words, words[1:]))
+
+        def run_legacy():
+            legacy_replace_synonyms(text, synonyms_dict)
+            for a, b in pairs:
+                legacy_are_synonyms(a, b, synonyms_dict)
+
+        index = SynonymIndex(synonyms_dict)
+
+        def run_index():
+            index.normalize(text)
+            for a, b in pairs:
+                index.are_synonyms(a, b)
+
+        repeat = 3
+        legacy = min(timeit.repeat(run_legacy, number=1, repeat=repeat)) * 1000
+        build = min(timeit.repeat(lambda: SynonymIndex(synonyms_dict), number=1, repeat=repeat)) * 1000
+        fast = min(timeit.repeat(run_index, number=1, repeat=repeat)) * 1000
+        print(f"{num_keys:>8} {legacy:>12.2f} {build:>11.2f} {fast:>11.2f} {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import argparse
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from diff_engine import (diff_opcodes, diff_words, intern_tokens, ANCHOR_MIN_TOKENS, MAX_EDIT_COST,  # noqa: E402
+                         DELETE, INSERT, SUBSTITUTE)
+
+# Comprobación aleatoria de diff_engine.py sobre pares de listas de palabras
+# (textos parecidos con ediciones sueltas y textos sin relación):
+#   - los opcodes cubren las dos entradas de forma contigua y sin huecos;
+#   - los bloques "equal" coinciden de verdad;
+#   - en tramos menores que ANCHOR_MIN_TOKENS (sin anclas) y con menos de
+#     MAX_EDIT_COST ediciones, la diferencia es mínima (igual a la que da la
+#     subsecuencia común más larga);
+#   - los cambios de diff_words corresponden a las palabras de cada texto y
+#     cada bloque de borrados e inserciones seguidos (en cualquier orden) da
+#     max(borradas, insertadas) cambios: lo que se puede emparejar es una
+#     sustitución, no un borrado más una inserción;
+#   - algunos ejemplos fijos con el resultado esperado.
+# Termina con error si algún caso falla e indica la semilla para repetirlo.
+#
+# Uso:
+#   python benchmarks/check_diff.py --cases 300 --seed 1
+
+
+def random_words(rng, length, vocabulary):
+    return [f"w{rng.randrange(vocabulary)}" for _ in range(length)]
+
+
+def mutate(rng, words, edits, vocabulary):
+    # Copia de words con edits borrados, inserciones y sustituciones al azar
+    words = list(words)
+    for _ in range(edits):
+        op = rng.randrange(3)
+        position = rng.randrange(len(words) + 1)
+        if op == 0 and position < len(words):
+            del words[position]
+        elif op == 1 or position == len(words):
+            words.insert(position, f"w{rng.randrange(vocabulary)}")
+        else:
+            words[position] = f"w{rng.randrange(vocabulary)}"
+    return words
+
+
+def random_case(rng, max_length):
+    vocabulary = rng.choice([3, 10, 50, 1000])
+    words1 = random_words(rng, rng.randrange(max_length + 1), vocabulary)
+    if rng.random() < 0.2:
+        words2 = random_words(rng, rng.randrange(max_length + 1), vocabulary)
+    else:
+        words2 = mutate(rng, words1, rng.randrange(max(1, len(words1) // 3) + 1), vocabulary)
+    return words1, words2
+
+
+def lcs_length(a, b):
+    # Programación dinámica O(N·M), solo para comprobar casos pequeños
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def check_opcodes(a, b, opcodes):
+    # Cobertura contigua de las dos entradas y bloques "equal" correctos
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j), f"hueco o solape en {(tag, i1, i2, j1, j2)}, se esperaba empezar en {(i, j)}"
+        assert i1 <= i2 and j1 <= j2 and (i1, j1) != (i2, j2), f"opcode vacío o invertido {(tag, i1, i2, j1, j2)}"
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2], f"bloque equal distinto {(i1, i2, j1, j2)}"
+        elif tag == "delete":
+            assert j1 == j2, f"delete con palabras nuevas {(i1, i2, j1, j2)}"
+        elif tag == "insert":
+            assert i1 == i2, f"insert con palabras antiguas {(i1, i2, j1, j2)}"
+        else:
+            raise AssertionError(f"opcode desconocido {tag}")
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b)), f"los opcodes terminan en {(i, j)}, no en {(len(a), len(b))}"
+
+
+def check_changes(words1, words2, changes):
+    # Cada cambio apunta a sus palabras y lo que no cambia es común a los dos textos
+    touched_old = set()
+    touched_new = set()
+    for change in changes:
+        if change.op in (DELETE, SUBSTITUTE):
+            assert words1[change.old_index] == change.old_word, f"palabra antigua errónea en {change}"
+            touched_old.add(change.old_index)
+        if change.op in (INSERT, SUBSTITUTE):
+            assert words2[change.new_index] == change.new_word, f"palabra nueva errónea en {change}"
+            touched_new.add(change.new_index)
+    kept_old = [w for i, w in enumerate(words1) if i not in touched_old]
+    kept_new = [w for j, w in enumerate(words2) if j not in touched_new]
+    assert kept_old == kept_new, "las palabras sin cambios no coinciden en los dos textos"
+    return len(kept_old)
+
+
+def check_pairing(opcodes, changes):
+    # Cambios esperados: por cada bloque de opcodes distintos de "equal", max(borradas, insertadas)
+    expected = 0
+    deleted = inserted = 0
+    for tag, i1, i2, j1, j2 in opcodes + [("equal", 0, 0, 0, 0)]:
+        if tag == "equal":
+            expected += max(deleted, inserted)
+            deleted = inserted = 0
+        else:
+            deleted += i2 - i1
+            inserted += j2 - j1
+    assert len(changes) == expected, f"{len(changes)} cambios, se esperaban {expected} emparejando cada bloque"
+
+
+def check_case(words1, words2, max_cost=MAX_EDIT_COST):
+    a, b = intern_tokens(words1, words2)
+    opcodes = diff_opcodes(a, b, max_cost)
+    check_opcodes(a, b, opcodes)
+    changes = diff_words(words1, words2, max_cost)
+    check_pairing(opcodes, changes)
+    common = check_changes(words1, words2, changes)
+
+    if len(a) + len(b) <= ANCHOR_MIN_TOKENS:
+        lcs = lcs_length(a, b)
+        if len(a) + len(b) - 2 * lcs < max_cost:
+            edits = sum(i2 - i1 + j2 - j1 for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+            assert edits == len(a) + len(b) - 2 * lcs, \
+                f"diferencia no mínima: {edits} ediciones, el mínimo es {len(a) + len(b) - 2 * lcs}"
+            assert common == lcs, f"diff_words conserva {common} palabras, la subsecuencia común tiene {lcs}"
+
+
+EXAMPLES = [
+    # (texto 1, texto 2, cambios esperados como (op, palabra antigua, palabra nueva))
+    (["a", "X"], ["b", "a", "Y"], [(INSERT, None, "b"), (SUBSTITUTE, "X", "Y")]),
+    ("i am tall".split(), "so i am short".split(), [(INSERT, None, "so"), (SUBSTITUTE, "tall", "short")]),
+    ("we go to school".split(), "we went to school".split(), [(SUBSTITUTE, "go", "went")]),
+    ("one two three".split(), "one three".split(), [(DELETE, "two", None)]),
+    ([], ["x"], [(INSERT, None, "x")]),
+    (["x"], [], [(DELETE, "x", None)]),
+]
+
+
+def check_examples():
+    for words1, words2, expected in EXAMPLES:
+        changes = [(c.op, c.old_word, c.new_word) for c in diff_words(words1, words2)]
+        assert changes == expected, f"{words1} -> {words2}: {changes}, se esperaba {expected}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=300, help="casos aleatorios por tipo")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # (nombre, longitud máxima de cada texto, max_cost)
+    kinds = [
+        ("pequeños, mínimos", ANCHOR_MIN_TOKENS // 2, MAX_EDIT_COST),
+        ("pequeños, coste acotado", ANCHOR_MIN_TOKENS // 2, 8),
+        ("grandes, con anclas", 4 * ANCHOR_MIN_TOKENS, MAX_EDIT_COST),
+    ]
+    failures = 0
+    try:
+        check_examples()
+        print("ok    ejemplos fijos")
+    except AssertionError as e:
+        failures += 1
+        print(f"FALLO ejemplos fijos: {e}")
+    for name, max_length, max_cost in kinds:
+        failed = 0
+        for n in range(args.cases):
+            words1, words2 = random_case(rng, max_length)
+            try:
+                check_case(words1, words2, max_cost)
+            except AssertionError as e:
+                failed += 1
+                if failed <= 3:
+                    print(f"FALLO {name} (caso {n}, --seed {args.seed}): {e}")
+        failures += failed
+        print(f"{'ok   ' if not failed else 'FALLO'} {name}: {args.cases - failed}/{args.cases}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from resilience import (Backend, CircuitBreaker, BackendUnavailableError, BackendTimeoutError,  # noqa: E402
+                        CLOSED, OPEN, HALF_OPEN)
+
+# Comprobaciones de resilience.py: transiciones del circuit breaker (cerrado,
+# abierto, semiabierto y vuelta a cerrado), rechazo por cola llena o por espera
+# agotada, reintentos y errores que no cuentan como fallo. Termina con error si
+# alguna falla.
+#
+# Uso:
+#   python benchmarks/check_resilience.py
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ServiceError(Exception):
+    pass
+
+
+class NotUnderstood(Exception):
+    pass
+
+
+def failing():
+    raise ServiceError("fallo")
+
+
+def check_breaker_transitions():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0, clock=clock)
+    assert breaker.state == CLOSED and breaker.try_acquire()
+
+    # Los éxitos reinician la cuenta de fallos seguidos
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    # Tercer fallo seguido: se abre y no deja pasar llamadas
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.try_acquire()
+    assert breaker.retry_after() == 10.0
+
+    # Fallos tardíos de llamadas anteriores no alargan el tiempo abierto
+    clock.now = 4.0
+    breaker.record_failure()
+    assert breaker.retry_after() == 6.0
+
+    # Pasado reset_timeout: semiabierto, una sola llamada de prueba
+    clock.now = 10.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.try_acquire()
+    assert not breaker.try_acquire()
+
+    # La prueba falla: se vuelve a abrir durante otro reset_timeout
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == 10.0
+
+    # Una prueba cancelada (error local) deja pasar otra
+    clock.now = 20.0
+    assert breaker.try_acquire()
+    breaker.cancel_probe()
+    assert breaker.try_acquire()
+
+    # La prueba sale bien: cerrado
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.try_acquire()
+
+
+def check_backend_open_fails_fast():
+    backend = Backend("prueba", failure_threshold=2, reset_timeout=60.0, queue_timeout=1.0, retries=0,
+                      retry_on=(ServiceError,))
+    for _ in range(2):
+        try:
+            backend.call(failing)
+        except ServiceError:
+            pass
+    assert backend.stats()["state"] == OPEN
+
+    calls = []
+    start = time.monotonic()
+    try:
+        backend.call(calls.append, 1)
+        raise AssertionError("la llamada debía rechazarse con el circuito abierto")
+    except BackendUnavailableError:
+        pass
+    assert time.monotonic() - start < 0.1, "con el circuito abierto se debe fallar enseguida"
+    assert not calls, "con el circuito abierto no se debe llamar al servicio"
+    assert backend.stats()["rejected"] == 1
+
+
+def check_backend_half_open_recovers():
+    backend = Backend("prueba", failure_threshold=1, reset_timeout=0.2, queue_timeout=1.0, retries=0,
+                      retry_on=(ServiceError,))
+    try:
+        backend.call(failing)
+    except ServiceError:
+        pass
+    assert backend.stats()["state"] == OPEN
+
+    # La espera cabe en queue_timeout: se espera a la llamada de prueba, que cierra el circuito
+    start = time.monotonic()
+    assert backend.call(lambda: "ok") == "ok"
+    assert time.monotonic() - start >= 0.15
+    assert backend.stats()["state"] == CLOSED
+
+
+def check_queue_rejection():
+    backend = Backend("prueba", max_concurrency=1, max_queue=1, queue_timeout=0.3, retries=0)
+    release = threading.Event()
+    started = threading.Event()
+    results = {}
+
+    def hold():
+        started.set()
+        release.wait(5)
+        return "primera"
+
+    def first():
+        results["first"] = backend.call(hold)
+
+    def second():
+        try:
+            results["second"] = backend.call(lambda: "segunda")
+        except BackendUnavailableError as e:
+            results["second"] = e
+
+    holder = threading.Thread(target=first)
+    holder.start()
+    started.wait(5)
+    waiter = threading.Thread(target=second)
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while backend.stats()["queue_depth"] != 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert backend.stats()["queue_depth"] == 1
+    assert backend.stats()["in_flight"] == 1
+
+    # La cola (de 1) está llena: la tercera llamada se rechaza sin esperar
+    start = time.monotonic()
+    try:
+        backend.call(lambda: "tercera")
+        raise AssertionError("la llamada debía rechazarse con la cola llena")
+    except BackendUnavailableError:
+        pass
+    assert time.monotonic() - start < 0.1
+
+    # La que espera se rechaza al agotar queue_timeout sin hueco libre
+    waiter.join(5)
+    assert isinstance(results["second"], BackendUnavailableError), results
+    release.set()
+    holder.join(5)
+    assert results["first"] == "primera"
+    stats = backend.stats()
+    assert stats["rejected"] == 2 and stats["in_flight"] == 0 and stats["queue_depth"] == 0
+    assert stats["state"] == CLOSED, "los rechazos no cuentan como fallos del servicio"
+
+
+def check_retries_and_errors():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ServiceError("fallo transitorio")
+        return "ok"
+
+    backend = Backend("prueba", retries=2, backoff_base=0.0, retry_on=(ServiceError,),
+                      no_retry=(NotUnderstood,))
+    assert backend.call(flaky) == "ok"
+    assert len(attempts) == 3 and backend.stats()["retries"] == 2
+
+    # Una respuesta válida en forma de excepción: ni se reintenta ni es un fallo
+    attempts.clear()
+
+    def not_understood():
+        attempts.append(1)
+        raise NotUnderstood()
+
+    try:
+        backend.call(not_understood)
+    except NotUnderstood:
+        pass
+    assert len(attempts) == 1 and backend.stats()["failures"] == 2
+
+    # Tiempo agotado en todos los intentos: BackendTimeoutError
+    def slow():
+        raise TimeoutError("sin respuesta")
+
+    try:
+        backend.call(slow)
+        raise AssertionError("se esperaba BackendTimeoutError")
+    except BackendTimeoutError:
+        pass
+    assert backend.stats()["timeouts"] == 3
+
+
+def check_fork_resets_backends():
+    # Un hijo creado con fork no hereda los circuitos ni los contadores del padre
+    if not hasattr(os, "fork"):
+        return
+    import app
+
+    app.get_backend("translator").call(lambda: None)
+    assert app.backend_stats()
+    pid = os.fork()
+    if pid == 0:
+        status = 0
+        try:
+            if app.backend_stats():
+                status = 1
+            else:
+                start = time.monotonic()
+                app.get_backend("translator").call(lambda: None)
+                status = 0 if time.monotonic() - start < 0.5 else 2
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0, f"el hijo terminó con {os.WEXITSTATUS(status)}"
+
+
+CHECKS = [check_breaker_transitions, check_backend_open_fails_fast, check_backend_half_open_recovers,
+          check_queue_rejection, check_retries_and_errors, check_fork_resets_backends]
+
+
+def main():
+    failures = 0
+    for check in CHECKS:
+        try:
+            check()
+        except AssertionError as e:
+            failures += 1
+            print(f"FALLO {check.__name__}: {e}")
+        else:
+            print(f"ok    {check.__name__}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
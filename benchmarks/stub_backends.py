@@ -0,0 +1,156 @@
+import io
+import math
+import random
+import struct
+import sys
+import threading
+import time
+import wave
+from array import array
+
+# Backends locales y deterministas que sustituyen a Google Speech y a
+# googletrans, para ejecutar el pipeline de /upload sin conexión.
+
+SCRIPT = ("hello my name is maria I live in madrid what is your name "
+          "I like the city it is big and beautiful thank you see you soon").split()
+
+
+class StubTranslation:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubRecognizer:
+    # Devuelve aproximadamente dos palabras por segundo de audio; la latencia
+    # simulada es delay + delay_per_second por cada segundo de audio
+    delay = 0.0
+    delay_per_second = 0.0
+
+    def recognize_google(self, audio, language="en-US"):
+        seconds = len(audio.frame_data) / float(audio.sample_rate * audio.sample_width)
+        if self.delay or self.delay_per_second:
+            time.sleep(self.delay + self.delay_per_second * seconds)
+        num_words = max(1, int(seconds * 2))
+        return " ".join(SCRIPT[i % len(SCRIPT)] for i in range(num_words))
+
+
+class StubTranslator:
+    # Traducción identidad: la ida y vuelta devuelve el mismo texto
+    delay = 0.0
+
+    def translate(self, text, src="auto", dest="en"):
+        if self.delay:
+            time.sleep(self.delay)
+        return StubTranslation(text)
+
+
+class FaultInjector:
+    # Fallos simulados de un servicio externo, compartidos por todos sus clientes:
+    #   - failure_rate: fracción de llamadas que fallan enseguida;
+    #   - slow_rate / slow_delay: fracción de llamadas que tardan slow_delay s más;
+    #   - outage: (inicio, fin) en segundos desde start() durante los que el
+    #     servicio está caído: cada llamada espera outage_delay s y falla;
+    #   - client_timeout: tiempo máximo del propio cliente (como operation_timeout
+    #     del reconocedor); una espera más larga termina con TimeoutError a ese tiempo
+    def __init__(self, failure_rate=0.0, slow_rate=0.0, slow_delay=0.0, outage=None, outage_delay=1.0,
+                 client_timeout=None, seed=0):
+        self.failure_rate = failure_rate
+        self.slow_rate = slow_rate
+        self.slow_delay = slow_delay
+        self.outage = outage
+        self.outage_delay = outage_delay
+        self.client_timeout = client_timeout
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def start(self):
+        self._started = time.monotonic()
+
+    def before_call(self, error):
+        # Aplicar el fallo que toque a esta llamada; error(mensaje) crea la excepción del servicio
+        with self._lock:
+            self.calls += 1
+            roll = self._random.random()
+            slow = self._random.random() < self.slow_rate
+        if self.outage:
+            elapsed = time.monotonic() - self._started
+            if self.outage[0] <= elapsed < self.outage[1]:
+                self._wait(self.outage_delay)
+                raise error("servicio caído (simulado)")
+        if roll < self.failure_rate:
+            raise error("fallo simulado")
+        if slow:
+            self._wait(self.slow_delay)
+
+    def _wait(self, delay):
+        if self.client_timeout is not None and delay > self.client_timeout:
+            time.sleep(self.client_timeout)
+            raise TimeoutError("tiempo de espera del cliente agotado (simulado)")
+        time.sleep(delay)
+
+
+def _recognizer_error(message):
+    import speech_recognition as sr
+    return sr.RequestError(message)
+
+
+def install(app, recognizer_delay=0.0, translator_delay=0.0, recognizer_delay_per_second=0.0,
+            recognizer_faults=None, translator_faults=None):
+    # Sustituir los backends de la aplicación por las versiones locales
+    recognizer = type("DelayedStubRecognizer", (StubRecognizer,),
+                      {"delay": recognizer_delay, "delay_per_second": recognizer_delay_per_second})
+    translator = type("DelayedStubTranslator", (StubTranslator,), {"delay": translator_delay})
+    if recognizer_faults is not None:
+        recognizer = _with_faults(recognizer, "recognize_google", recognizer_faults, _recognizer_error)
+    if translator_faults is not None:
+        translator = _with_faults(translator, "translate", translator_faults, ConnectionError)
+    app.config['RECOGNIZER_FACTORY'] = recognizer
+    app.config['TRANSLATOR_FACTORY'] = translator
+
+
+def _with_faults(base, method_name, faults, error):
+    # Subclase de base cuyo método method_name pasa antes por el inyector de fallos
+    method = getattr(base, method_name)
+
+    def faulty(self, *args, **kwargs):
+        faults.before_call(error)
+        return method(self, *args, **kwargs)
+
+    return type("Faulty" + base.__name__, (base,), {method_name: faulty})
+
+
+def make_wav(seconds, sample_rate=16000, channels=1, sample_width=2, frequency=220.0):
+    # WAV sintético: tono senoidal con pausas de 0.25 s cada segundo. Se
+    # genera un segundo de audio y se repite, así que es rápido incluso para
+    # grabaciones largas
+    amplitude = 0.3 * (2 ** (8 * sample_width - 1) - 1)
+    typecode = {1: "B", 2: "h", 4: "i"}[sample_width]
+    period = array(typecode)
+    for n in range(sample_rate):
+        t = n / sample_rate
+        value = 0.0 if t > 0.75 else amplitude * math.sin(2 * math.pi * frequency * t)
+        sample = int(value) + (128 if sample_width == 1 else 0)
+        period.extend([sample] * channels)
+    period_bytes = period.tobytes()
+    if sys.byteorder == "big":
+        period.byteswap()
+        period_bytes = period.tobytes()
+
+    num_bytes = int(seconds * sample_rate) * channels * sample_width
+    repeats = num_bytes // len(period_bytes) + 1
+    frames = (period_bytes * repeats)[:num_bytes]
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(sample_width)
+        f.setframerate(sample_rate)
+        f.writeframes(frames)
+    return buffer.getvalue()
+
+
+def make_unique(wav_bytes, n):
+    # Cambiar la última muestra para que el almacén de subidas no deduplique
+    return wav_bytes[:-4] + struct.pack("<I", n)
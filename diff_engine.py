@@ -0,0 +1,256 @@
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+# Motor de diferencias entre listas de palabras:
+#   - las palabras se convierten en identificadores enteros (internado) y se
+#     guardan en arrays compactos;
+#   - las palabras comunes que aparecen una sola vez en cada texto sirven de
+#     anclas (como en "patience diff") y parten el problema en tramos cortos;
+#   - cada tramo se resuelve con el algoritmo de Myers en espacio lineal
+#     (bisección por el "middle snake"), sin recursión profunda;
+#   - el resultado son registros de cambio (borrado, inserción, sustitución)
+#     con su posición en cada texto.
+
+Change = namedtuple("Change", ["op", "old_index", "new_index", "old_word", "new_word"])
+
+DELETE = "delete"
+INSERT = "insert"
+SUBSTITUTE = "substitute"
+
+# Coste máximo (número de ediciones) que se explora en una bisección; al
+# superarlo se corta por el punto que más ha avanzado (como la heurística
+# "too expensive" de GNU diff), lo que acota el peor caso O(N·D)
+MAX_EDIT_COST = 256
+
+# Solo se buscan anclas en tramos grandes; los pequeños se resuelven con
+# Myers, que da siempre la diferencia mínima
+ANCHOR_MIN_TOKENS = 256
+
+
+def intern_tokens(words1, words2):
+    ids = {}
+    a = array("i", [ids.setdefault(w, len(ids)) for w in words1])
+    b = array("i", [ids.setdefault(w, len(ids)) for w in words2])
+    return a, b
+
+
+def _unique_anchors(a, alo, ahi, b, blo, bhi):
+    # Pares (i, j) de tokens que aparecen exactamente una vez en cada tramo,
+    # reducidos a la subsecuencia creciente más larga
+    count_a = {}
+    for i in range(alo, ahi):
+        token = a[i]
+        count_a[token] = -1 if token in count_a else i
+    count_b = {}
+    for j in range(blo, bhi):
+        token = b[j]
+        count_b[token] = -1 if token in count_b else j
+
+    pairs = [(i, count_b[token]) for token, i in count_a.items()
+             if i >= 0 and count_b.get(token, -1) >= 0]
+    if not pairs:
+        return []
+    pairs.sort()
+
+    # Subsecuencia creciente más larga sobre j (patience sorting)
+    tails = []
+    tail_index = []
+    previous = [-1] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_index.append(n)
+        else:
+            tails[pos] = j
+            tail_index[pos] = n
+        previous[n] = tail_index[pos - 1] if pos > 0 else -1
+
+    anchors = []
+    n = tail_index[-1]
+    while n >= 0:
+        anchors.append(pairs[n])
+        n = previous[n]
+    anchors.reverse()
+    return anchors
+
+
+def _bisect(a, alo, ahi, b, blo, bhi, max_cost):
+    # Myers en espacio lineal: devuelve el punto (x, y) donde se cruzan el
+    # camino hacia delante y el camino hacia atrás; si se supera max_cost, el
+    # punto del camino hacia delante más avanzado; None si no hay nada en común
+    len1 = ahi - alo
+    len2 = bhi - blo
+    max_d = (len1 + len2 + 1) // 2
+    v_offset = max_d
+    v_length = 2 * max_d + 2
+    v1 = [-1] * v_length
+    v2 = [-1] * v_length
+    v1[v_offset + 1] = 0
+    v2[v_offset + 1] = 0
+    delta = len1 - len2
+    front = delta % 2 != 0
+    k1start = k1end = k2start = k2end = 0
+    best = None
+    best_progress = 0
+
+    for d in range(max_d):
+        if d >= max_cost:
+            return best
+        # Camino hacia delante
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < len1 and y1 < len2 and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 <= len1 and y1 <= len2 and x1 + y1 > best_progress and x1 + y1 < len1 + len2:
+                best = (x1, y1)
+                best_progress = x1 + y1
+            if x1 > len1:
+                k1end += 2
+            elif y1 > len2:
+                k1start += 2
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    if x1 >= len1 - v2[k2_offset]:
+                        return x1, y1
+
+        # Camino hacia atrás
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < len1 and y2 < len2 and a[ahi - 1 - x2] == b[bhi - 1 - y2]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > len1:
+                k2end += 2
+            elif y2 > len2:
+                k2start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    y1 = v_offset + x1 - k1_offset
+                    if x1 >= len1 - x2:
+                        return x1, y1
+    return None
+
+
+def diff_opcodes(a, b, max_cost=MAX_EDIT_COST):
+    # Opcodes al estilo de difflib ('equal', 'delete', 'insert') sobre dos arrays de enteros
+    opcodes = []
+
+    def emit(tag, i1, i2, j1, j2):
+        if i1 == i2 and j1 == j2:
+            return
+        if opcodes and opcodes[-1][0] == tag:
+            _, pi1, _, pj1, _ = opcodes[-1]
+            opcodes[-1] = (tag, pi1, i2, pj1, j2)
+        else:
+            opcodes.append((tag, i1, i2, j1, j2))
+
+    # Pila de trabajo: tramos por resolver o "equal" pendientes, en orden inverso
+    stack = [("range", 0, len(a), 0, len(b), True)]
+    while stack:
+        item = stack.pop()
+        if item[0] == "equal":
+            _, i1, i2, j1, j2 = item
+            emit("equal", i1, i2, j1, j2)
+            continue
+
+        _, alo, ahi, blo, bhi, use_anchors = item
+
+        # Prefijo y sufijo comunes
+        prefix = 0
+        while alo + prefix < ahi and blo + prefix < bhi and a[alo + prefix] == b[blo + prefix]:
+            prefix += 1
+        emit("equal", alo, alo + prefix, blo, blo + prefix)
+        alo += prefix
+        blo += prefix
+        suffix = 0
+        while ahi - suffix > alo and bhi - suffix > blo and a[ahi - 1 - suffix] == b[bhi - 1 - suffix]:
+            suffix += 1
+        ahi -= suffix
+        bhi -= suffix
+        if suffix:
+            stack.append(("equal", ahi, ahi + suffix, bhi, bhi + suffix))
+
+        if alo == ahi or blo == bhi:
+            emit("delete", alo, ahi, blo, blo)
+            emit("insert", ahi, ahi, blo, bhi)
+            continue
+
+        anchors = []
+        if use_anchors and (ahi - alo) + (bhi - blo) > ANCHOR_MIN_TOKENS:
+            anchors = _unique_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            # Tramos entre anclas consecutivas; cada ancla es una palabra igual
+            segments = []
+            i, j = alo, blo
+            for ai, bj in anchors:
+                segments.append(("range", i, ai, j, bj, True))
+                segments.append(("equal", ai, ai + 1, bj, bj + 1))
+                i, j = ai + 1, bj + 1
+            segments.append(("range", i, ahi, j, bhi, True))
+            stack.extend(reversed(segments))
+            continue
+
+        split = _bisect(a, alo, ahi, b, blo, bhi, max_cost)
+        if split is None:
+            # Sin nada en común: reemplazo completo
+            emit("delete", alo, ahi, blo, blo)
+            emit("insert", ahi, ahi, blo, bhi)
+            continue
+        x, y = split
+        stack.append(("range", alo + x, ahi, blo + y, bhi, False))
+        stack.append(("range", alo, alo + x, blo, blo + y, False))
+
+    return opcodes
+
+
+def diff_words(words1, words2, max_cost=MAX_EDIT_COST):
+    # Registros de cambio entre dos listas de palabras. Los borrados e
+    # inserciones seguidos (en cualquier orden, la bisección puede dar primero
+    # la inserción) forman un bloque que se empareja palabra a palabra como
+    # sustituciones; lo que sobra queda como borrado o inserción
+    a, b = intern_tokens(words1, words2)
+    changes = []
+    opcodes = diff_opcodes(a, b, max_cost)
+    n = 0
+    while n < len(opcodes):
+        tag, i1, i2, j1, j2 = opcodes[n]
+        if tag == "equal":
+            n += 1
+            continue
+        # Dentro del bloque los borrados son contiguos en words1 y las inserciones en words2
+        while n + 1 < len(opcodes) and opcodes[n + 1][0] != "equal":
+            n += 1
+            i2, j2 = opcodes[n][2], opcodes[n][4]
+        n += 1
+        deleted = (i1, i2)
+        inserted = (j1, j2)
+
+        num_deleted = deleted[1] - deleted[0]
+        num_inserted = inserted[1] - inserted[0]
+        for k in range(min(num_deleted, num_inserted)):
+            i = deleted[0] + k
+            j = inserted[0] + k
+            changes.append(Change(SUBSTITUTE, i, j, words1[i], words2[j]))
+        for i in range(deleted[0] + num_inserted, deleted[1]):
+            changes.append(Change(DELETE, i, inserted[1], words1[i], None))
+        for j in range(inserted[0] + num_deleted, inserted[1]):
+            changes.append(Change(INSERT, deleted[1], j, None, words2[j]))
+    return changes
@@ -0,0 +1,123 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Cola de trabajos en memoria para el modo asíncrono de /upload.
+# Un pool de hilos acotado ejecuta el pipeline (transcripción, traducción,
+# diferencias y fluidez) y cada trabajo guarda su estado y su etapa actual
+# para que /status/<id> y /result/<id> puedan consultarlos. La cola es de un
+# solo proceso: on_update(job) se llama en cada cambio de estado o de etapa
+# para que la aplicación lo guarde donde lo vean los demás workers; updated_at
+# marca la última vez, para que quien lo lea detecte un trabajo abandonado.
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+ERROR = "error"
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, job_id):
+        self.id = job_id
+        self.status = QUEUED
+        self.stage = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobQueue:
+    def __init__(self, max_workers=4, max_pending=100, job_ttl=3600, on_update=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self.max_pending = max_pending
+        self.job_ttl = job_ttl
+        self.on_update = on_update or (lambda job: None)
+
+    def submit(self, fn, *args, job_id=None):
+        # fn(*args, progress=...) devuelve el resultado; progress(stage) informa de la etapa.
+        # Con job_id, un trabajo con ese id aún en cola o en curso no se repite
+        with self._lock:
+            self._evict_finished()
+            existing = self._jobs.get(job_id)
+            if existing is not None and existing.status in (QUEUED, RUNNING):
+                return existing.id
+            pending = sum(1 for job in self._jobs.values() if job.status in (QUEUED, RUNNING))
+            if pending >= self.max_pending:
+                raise QueueFullError("Demasiados trabajos en cola")
+            job = Job(job_id or uuid.uuid4().hex)
+            self._jobs[job.id] = job
+
+        try:
+            self._update(job)
+        except Exception:
+            # Sin estado guardado el trabajo no se encola
+            with self._lock:
+                del self._jobs[job.id]
+            raise
+        self._executor.submit(self._run, job, fn, args)
+        return job.id
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def pending_count(self):
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status in (QUEUED, RUNNING))
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def _update(self, job):
+        job.updated_at = time.time()
+        self.on_update(job)
+
+    def _run(self, job, fn, args):
+        def progress(stage):
+            job.stage = stage
+            self._update(job)
+
+        # Un fallo al guardar el estado también termina el trabajo con error;
+        # el estado final se guarda siempre
+        try:
+            job.status = RUNNING
+            self._update(job)
+            job.result = fn(*args, progress=progress)
+            job.status = DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = ERROR
+        finally:
+            job.finished_at = time.time()
+            try:
+                self._update(job)
+            except Exception:
+                # Este proceso sigue respondiendo con el estado real; los demás
+                # verán el guardado anterior como abandonado al caducar
+                pass
+
+    def _evict_finished(self):
+        # Olvidar los trabajos terminados hace más de job_ttl segundos
+        limit = time.time() - self.job_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and job.finished_at < limit]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -0,0 +1,190 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Instrumentación ligera en proceso:
+#   - histogramas y contadores con etiquetas, renderizados en formato Prometheus;
+#   - span(stage) mide una etapa del pipeline, la registra en el histograma de
+#     latencias y, si la petición actual recoge tiempos, la añade para la
+#     cabecera Server-Timing.
+# Cada observación es un perf_counter, un bisect y un incremento bajo un lock,
+# así que se puede dejar activado en producción.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+SIZE_BUCKETS = tuple(16 * 1024 * 4 ** n for n in range(8))  # 16 KiB .. 256 MiB
+
+
+def _format_labels(label_names, label_values, extra=()):
+    pairs = list(zip(label_names, label_values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = [(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+               for name, value in pairs]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS, label_names=()):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        self._series = {}  # etiquetas -> [conteos por bucket (+Inf al final), suma]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(key, list(counts), total) for key, (counts, total) in sorted(self._series.items())]
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.label_names, key, [("le", _format_value(float(bound)))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    # Valor calculado en el momento de exportar (p. ej. trabajos en cola, o
+    # contadores que ya lleva otro componente). Con label_names, el callback
+    # devuelve un dict {valores de las etiquetas: valor}
+    def __init__(self, name, help_text, callback, metric_type="gauge", label_names=()):
+        self.name = name
+        self.help = help_text
+        self.callback = callback
+        self.metric_type = metric_type
+        self.label_names = tuple(label_names)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.metric_type}"]
+        try:
+            value = self.callback()
+        except Exception:
+            return lines
+        if not self.label_names:
+            lines.append(f"{self.name} {_format_value(value)}")
+            return lines
+        for key, labeled_value in sorted(value.items()):
+            if not isinstance(key, tuple):
+                key = (key,)
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(labeled_value)}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, label_names=()):
+        return self.register(Counter(name, help_text, label_names))
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, label_names=()):
+        return self.register(Histogram(name, help_text, buckets, label_names))
+
+    def gauge(self, name, help_text, callback, label_names=()):
+        return self.register(CallbackMetric(name, help_text, callback, "gauge", label_names))
+
+    def counter_callback(self, name, help_text, callback, label_names=()):
+        return self.register(CallbackMetric(name, help_text, callback, "counter", label_names))
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+stage_seconds = registry.histogram(
+    "eva_stage_duration_seconds", "Duración de cada etapa del pipeline de /upload",
+    LATENCY_BUCKETS, ["stage"])
+stage_errors = registry.counter(
+    "eva_stage_errors_total", "Excepciones por etapa (p. ej. UnknownValueError, RequestError)", ["stage", "type"])
+upload_bytes = registry.histogram(
+    "eva_upload_size_bytes", "Tamaño de los archivos subidos", SIZE_BUCKETS)
+
+_local = threading.local()
+
+
+def begin_request():
+    # Empezar a recoger los tiempos de las etapas de la petición actual
+    _local.timings = []
+
+
+def end_request():
+    timings = getattr(_local, "timings", None)
+    _local.timings = None
+    return timings or []
+
+
+@contextmanager
+def span(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        stage_errors.inc(stage=stage, type=type(e).__name__)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        stage_seconds.observe(duration, stage=stage)
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings.append((stage, duration))
+
+
+def server_timing_header(timings):
+    # Varias mediciones de la misma etapa (p. ej. dos traducciones) se suman
+    totals = {}
+    for stage, duration in timings:
+        totals[stage] = totals.get(stage, 0.0) + duration
+    return ", ".join(f"{stage};dur={duration * 1000:.1f}" for stage, duration in totals.items())
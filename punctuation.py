@@ -0,0 +1,183 @@
+import re
+
+# Motor de puntuación: las listas de combinaciones y las expresiones regulares
+# se construyen una sola vez al importar el módulo, en lugar de en cada llamada
+# a add_question_marks.
+
+question_words_combinations = [
+    ("who", ["is", "was", "are", "were", "did", "does"]),
+    ("what", ["is", "time", "are", "was", "were", "do", "does", "goes", "works"]),
+    ("where", ["is", "are", "does", "was", "were"]),
+    ("when", ["is", "was", "are", "were"]),
+    ("why", ["is", "are", "do", "does", "was", "were", "I", "you", "he", "she", "it"]),
+    ("how", ["is", "are", "do", "does", "was", "were", "many", "much"]),
+    ("which", ["is", "are", "was", "were"]),
+    ("whom", ["did", "does", "is", "was"]),
+    ("whose", ["is", "are"]),
+    ("how many", ["is", "are", "do", "does"]),
+    ("how much", ["is", "are", "does", "do"]),
+    ("how long", ["is", "are", "do", "does"]),
+    ("how far", ["is", "are", "do", "does"]),
+    ("how often", ["do", "does", "is", "are"]),
+    ("how old", ["is", "are"]),
+    ("how come", ["is", "are", "did"]),
+    ("what time", ["is", "does"]),
+    ("what kind", ["is", "are"]),
+    ("what else", ["is", "are"]),
+    ("what about", ["is", "are"]),
+    ("who else", ["is", "are"]),
+    ("who did", ["it", "you", "they"]),
+    ("who was", ["it", "he", "she"]),
+    ("who is", ["it", "he", "she"]),
+    ("will", ["I", "you", "he", "she", "we", "they"]),
+    ("can", ["I", "you", "he", "she", "we", "they"]),
+    ("could", ["I", "you", "he", "she", "we", "they"]),
+    ("would", ["I", "you", "he", "she", "we", "they"]),
+    ("do", ["I", "you", "he", "she", "it", "we", "they"]),
+    ("does", ["he", "she", "it"]),
+    ("did", ["I", "you", "he", "she", "it", "we", "they"]),
+    
+    ("is", ["he", "she", "it"]),
+    ("are", ["you", "we", "they"]),
+    ("am", ["I"]),
+    
+    ("was", ["I", "he", "she", "it"]),
+    ("were", ["you", "we", "they"]),
+    ("has", ["he", "she", "it"]),
+    ("have", ["I", "you", "we", "they"]),
+    ("had", ["I", "you", "he", "she", "it", "we", "they"]),
+    ("may", ["I", "you", "he", "she", "it", "we", "they"]),
+    ("might", ["I", "you", "he", "she", "it", "we", "they"]),
+    ("shall", ["I", "we"]),
+    ("should", ["I", "you", "he", "she", "it", "we", "they"]),
+    ("must", ["I", "you", "he", "she", "it", "we", "they"])
+]
+
+# Lista de pronombres y sus combinaciones
+pronouns_combinations = [
+    ("I", ["do", "don't", "am", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
+    ("you", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
+    ("we", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
+    ("they", ["do", "don't", "are", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "go", "work", "eat", "sleep", "play", "read", "write", "speak", "study", "run", "walk", "talk", "watch", "listen", "understand", "want", "need", "like", "love", "hate", "believe", "think", "help", "ask", "answer", "try", "enjoy", "hope", "feel", "wait", "bring", "carry", "drive", "buy", "sell", "teach", "learn", "see", "hear", "feel", "hold", "build", "workout", "cook", "travel", "stay", "live", "grow", "clean", "paint", "dance", "sing", "jump", "swim", "call", "play", "study", "remember", "forget", "understand", "buy", "pay", "open", "close", "set", "build", "work", "finish", "start", "move", "turn", "use", "create", "call", "help", "try", "play", "drive", "run", "watch", "choose", "change", "build", "draw", "train", "know", "push", "shut", "read", "accept", "push", "call", "help", "talk", "walk", "wear", "watch", "work", "have", "live", "create", "work", "write", "love", "wish", "understand", "open", "study", "sleep", "teach", "eat", "speak", "play", "finish", "stop", "hold", "wait", "run", "move", "turn", "read", "bring", "finish", "help", "play", "stay", "push", "take", "drive", "take", "start", "understand", "learn", "finish", "grow", "clean", "send", "stop", "talk", "sing", "write", "climb", "jump", "dance", "help", "play", "open", "close", "work", "have", "bring", "try", "help", "take", "get", "take", "run", "change", "work", "move", "turn", "get", "need", "believe", "wish", "live", "see", "watch", "listen", "draw", "speak", "try", "answer", "speak", "play", "study", "like"]),
+   
+    ("she", ["does", "doesn't", "is", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
+    ("he", ["does", "doesn't", "is", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
+    ("it", [ "is", "doesn't", "always", "usually", "frequently", "often", "sometimes", "occasionally", "rarely", "seldom", "never", "goes", "works", "eats", "sleeps", "plays", "reads", "writes", "speaks", "studies", "runs", "walks", "talks", "watches", "listens", "understands", "wants", "needs", "likes", "loves", "hates", "believes", "thinks", "helps", "asks", "answers", "tries", "enjoys", "hopes", "feels", "waits", "brings", "carries", "drives", "buys", "sells", "teaches", "learns", "sees", "hears", "holds", "builds", "works out", "cooks", "travels", "stays", "lives", "grows", "cleans", "paints", "dances", "sings", "jumps", "swims", "calls", "plays", "studies", "remembers", "forgets", "understands", "pays", "opens", "closes", "sets", "finishes", "starts", "moves", "turns", "uses", "creates", "chooses", "changes", "draws", "trains", "knows", "pushes", "shuts", "accepts", "talks", "walks", "wears", "has", "creates", "writes", "wishes", "opens", "sleeps", "teaches", "eats", "speaks", "finishes", "stops", "holds", "waits", "runs", "moves", "turns", "brings", "stays", "takes", "drives", "starts", "learns", "grows", "cleans", "sends", "talks", "sings", "climbs", "plays", "opens", "closes", "has", "brings", "takes", "gets", "runs", "changes", "moves", "needs", "believes", "sees", "watches", "listens", "draws", "speaks", "answers", "studies", "likes"]),
+   
+    ("I'm", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("you're", ["welcome", "going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("we're", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("they're", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("she's", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("he's", ["going", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("it's", ["going", "a", "working", "eating", "sleeping", "playing", "reading", "writing", "speaking", "studying", "running", "walking", "talking", "watching", "listening", "understanding", "wanting", "needing", "liking", "loving", "hating", "believing", "thinking", "helping", "asking", "answering", "trying", "enjoying", "hoping", "feeling", "waiting", "bringing", "carrying", "driving", "buying", "selling", "teaching", "learning", "seeing", "hearing", "holding", "building", "working out", "cooking", "traveling", "staying", "living", "growing", "cleaning", "painting", "dancing", "singing", "jumping", "swimming", "calling", "studying", "remembering", "forgetting", "understanding", "paying", "opening", "closing", "setting", "finishing", "starting", "moving", "turning", "using", "creating", "helping", "driving", "choosing", "changing", "drawing", "training", "knowing", "pushing", "shutting", "accepting", "talking", "wearing", "having", "loving", "wishing", "studying", "sleeping", "teaching", "speaking", "stopping", "holding", "waiting", "taking", "getting", "running", "changing", "finishing", "sending", "climbing", "jumping", "dancing", "playing", "opening", "closing", "trying", "helping", "taking", "getting", "moving", "turning", "needing", "believing", "watching", "listening", "drawing", "answering", "studying", "liking"]),
+    ("thank", ["you"]),
+    ("thanks", ["so"]),
+    ("see", ["you soon", "you tomorrow", "you again"]),  
+    ("thanks", ["so", "for"]),
+    ("bye", ["bye"]),   
+    ("yes", ["I", "you", "we", "they", "she", "he", "it"]),
+    ("no", ["I", "you", "we", "they", "she", "he", "it"]), 
+    ("if", ["I", "you", "we", "they", "she", "he", "it"]),    
+    
+    ("the", ["book", "car", "house", "dog", "cat", "computer", "idea", "movie", "tree", "person", "problem", "question", "answer", "day", "night", "city", "town", "place", "school", "work", "friend", "family", "room", "party", "team", "teacher", "student", "company", "office", "restaurant", "game", "song", "event", "planet", "country", "continent", "mountain", "river", "lake", "ocean", "beach", "forest", "desert", "house", "street", "building", "shop", "store", "factory", "station", "bus", "train", "plane", "bike", "club", "service", "market", "home", "idea", "show", "problem", "discussion", "friendship", "relationship", "experience", "situation", "feeling", "thing", "place", "world", "universe", "moon", "star", "holiday", "celebration", "moment", "time", "space", "goal", "project", "plan", "dream", "wish", "challenge", "task", "plan", "activity", "journey", "experience", "opportunity", "idea", "meeting", "concept", "opinion", "thought", "discussion", "memory", "vision", "action", "decision", "topic", "news", "item", "object", "subject", "question", "answer", "result", "aspect", "case", "event", "strategy", "factor", "method", "technique", "idea", "argument", "resource", "role", "plan", "strategy", "solution", "problem", "debate", "point", "opinion", "reason", "goal", "wish", "success", "failure", "test", "exam", "study", "subject", "review", "review", "problem", "books", "cars", "houses", "dogs", "cats", "computers", "ideas", "movies", "trees", "persons", "problems", "questions", "answers", "days", "nights", "cities", "towns", "places", "schools", "works", "friends", "families", "rooms", "parties", "teams", "teachers", "students", "companies", "offices", "restaurants", "games", "songs", "events", "planets", "countries", "continents", "mountains", "rivers", "lakes", "oceans", "beaches", "forests", "deserts", "streets", "buildings", "shops", "stores", "factories", "stations", "buses", "trains", "planes", "bikes", "clubs", "services", "markets", "homes", "shows", "problems", "discussions", "friendships", "relationships", "experiences", "situations", "feelings", "things", "worlds", "universes", "moons", "stars", "holidays", "celebrations", "moments", "times", "spaces", "goals", "projects", "plans", "dreams", "wishes", "challenges", "tasks", "activities", "journeys", "opportunities", "meetings", "concepts", "opinions", "thoughts", "memories", "visions", "actions", "decisions", "topics", "news", "items", "objects", "subjects", "questions", "answers", "results", "aspects", "cases", "strategies", "factors", "methods", "techniques", "arguments", "resources", "roles", "solutions", "debates", "points", "reasons", "successes", "failures", "tests", "exams", "studies", "subjects", "reviews"])  
+]
+
+# Construir la expresión regular a partir de la lista de combinaciones de pronombres
+pronouns_pattern = "|".join([f"\\b{pronoun} ({'|'.join(combinations)})" for pronoun, combinations in pronouns_combinations])
+
+# Extraer las palabras de pregunta de la lista de combinaciones
+question_words = [pair[0] for pair in question_words_combinations]
+question_words_pattern = "|".join(question_words)
+
+# Expresiones regulares compiladas una sola vez
+_question_re = re.compile(rf"({question_words_pattern})(.*?)(\b{pronouns_pattern}\b)")
+_question_word_re = re.compile(rf"({question_words_pattern})\b(.*)")
+_pronouns_re = re.compile(pronouns_pattern)
+_period_before_question_word_re = re.compile(rf"(?<!\.)\s*(?=\b{question_words_pattern}\b)")
+_consecutive_periods_re = re.compile(r"\.\.+")
+_period_without_space_re = re.compile(r"(\.)(?=\S)")
+_space_before_period_re = re.compile(r"\s+\.")
+
+# Reglas de punto agrupadas por pronombre, en el mismo orden que la lista
+# (duplicados incluidos): (prefijo, [(frase, patrón), ...]).
+# Las frases no contienen puntos, así que insertar ". " nunca crea una frase
+# nueva: si la frase no está en el texto, su re.sub no cambiaría nada.
+# Los patrones se guardan como texto y se compilan la primera vez que su frase
+# aparece en un texto: compilar las ~2300 reglas al importar costaba ~0.2 s en
+# cada arranque de un worker.
+_period_rules = [
+    (f"{pronoun} ", [
+        (f"{pronoun} {combination}", rf"(\b{pronoun} {combination}\b)(?!\?)")
+        for combination in combinations
+    ])
+    for pronoun, combinations in pronouns_combinations
+]
+_compiled_period_rules = {}
+
+
+def _period_rule(pattern):
+    compiled = _compiled_period_rules.get(pattern)
+    if compiled is None:
+        compiled = _compiled_period_rules[pattern] = re.compile(pattern)
+    return compiled
+
+
+def add_question_marks(text):
+    # Primero agregamos signos de interrogación donde corresponde
+    match = _question_re.search(text)
+
+    if match:
+        # Buscar el índice en el que comienza el pronombre
+        pronoun_start_index = match.start(3)
+
+        # Verificar que el índice se haya encontrado
+        if pronoun_start_index != -1:
+            # Buscar el índice antes de un espacio antes del pronombre
+            question_mark_position = pronoun_start_index - 1
+
+            # Insertar el signo de interrogación justo antes del pronombre
+            modified_text = text[:question_mark_position] + "?" + text[question_mark_position:]
+            return modified_text  # Retornar el texto modificado
+        else:
+            return text
+    else:
+        # Buscar las palabras de pregunta al principio de la oración sin pronombres
+        question_match = _question_word_re.search(text)
+
+        if question_match:
+            rest_of_text = question_match.group(2).strip()
+
+            # Si no hay un pronombre después de la palabra de pregunta
+            if not _pronouns_re.search(rest_of_text):
+                # Agregar el signo de interrogación al final
+                text = text + "?"
+            else:
+                # Si ya hay un pronombre, dejamos el texto igual
+                return text
+
+    # Añadir puntos en otros lugares donde corresponda
+    for prefix, rules in _period_rules:
+        if prefix not in text:
+            continue
+        for phrase, pattern in rules:
+            # Buscar coincidencias de pronombre + verbo
+            if phrase in text:
+                text = _period_rule(pattern).sub(r". \1", text)
+
+    # Añadir un solo punto antes de la palabra de pregunta, si no está precedida de uno
+    text = _period_before_question_word_re.sub(".", text)
+
+    # Reemplazar puntos consecutivos por un solo punto
+    text = _consecutive_periods_re.sub(".", text)
+
+    # Asegurar que haya un espacio después de cada punto
+    text = _period_without_space_re.sub(r". ", text)
+
+    # Eliminar espacios innecesarios antes del punto
+    text = _space_before_period_re.sub(".", text)
+
+    # Eliminar punto al inicio si existe
+    text = text.lstrip(".").lstrip()
+
+    return text
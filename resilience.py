@@ -0,0 +1,213 @@
+import random
+import threading
+import time
+
+# Capa de resiliencia para los servicios externos (reconocimiento y traducción):
+#   - límite de llamadas simultáneas por servicio, con una cola de espera acotada;
+#   - reintentos con espera exponencial y jitter;
+#   - circuit breaker: tras varios fallos seguidos deja de llamar al servicio
+#     durante reset_timeout. Mientras está abierto, las llamadas esperan en la
+#     cola a que una llamada de prueba confirme que el servicio se ha recuperado;
+#     si la cola está llena o el circuito no se va a cerrar antes de que se
+#     agote la espera, fallan enseguida sin ocupar el worker.
+# La llamada se ejecuta en el hilo de quien llama (sin pools de hilos propios,
+# que no sobreviven a un fork). El tiempo máximo lo aplica el propio cliente
+# (operation_timeout del reconocedor, timeout del traductor); aquí solo se
+# reconocen sus errores de tiempo agotado (timeout_errors) para contarlos.
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BackendUnavailableError(Exception):
+    # No se llegó a llamar al servicio: circuito abierto o cola llena
+    pass
+
+
+class BackendTimeoutError(Exception):
+    # El servicio no respondió a tiempo en ningún intento
+    pass
+
+
+class CircuitBreaker:
+    # Sin lock propio: Backend lo usa siempre bajo su condición
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self):
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def retry_after(self):
+        # Segundos hasta que se permita una llamada de prueba
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def try_acquire(self):
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            # Una sola llamada de prueba a la vez
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self._state = CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def cancel_probe(self):
+        # La llamada de prueba falló por un error local, no del servicio: se permite otra
+        self._probing = False
+
+    def record_failure(self):
+        probe_failed = self._probing
+        self._probing = False
+        self._failures += 1
+        # Con el circuito ya abierto, los fallos de llamadas que empezaron antes
+        # no alargan el tiempo hasta la llamada de prueba
+        if probe_failed or (self._state == CLOSED and self._failures >= self.failure_threshold):
+            self._state = OPEN
+            self._opened_at = self._clock()
+
+
+class Backend:
+    def __init__(self, name, max_concurrency=4, max_queue=32, queue_timeout=10.0, timeout=30.0,
+                 retries=2, backoff_base=0.5, backoff_max=8.0, failure_threshold=5, reset_timeout=30.0,
+                 retry_on=(Exception,), no_retry=(), timeout_errors=(TimeoutError,), clock=time.monotonic):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        # Tiempo máximo configurado en el cliente; aquí solo se usa en los mensajes
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Excepciones que indican un fallo del servicio (se reintentan y cuentan
+        # para el circuito) y respuestas válidas aunque sean excepciones (p. ej.
+        # "no se entendió el audio")
+        self.retry_on = tuple(retry_on) + tuple(timeout_errors)
+        self.no_retry = tuple(no_retry)
+        self.timeout_errors = tuple(timeout_errors)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+        self.calls = 0
+        self.failures = 0
+        self.retried = 0
+        self.timeouts = 0
+        self.rejected = 0
+
+    def call(self, fn, *args, **kwargs):
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except self.no_retry:
+                self._record(success=True)
+                raise
+            except self.retry_on as e:
+                error = e
+                if isinstance(e, self.timeout_errors):
+                    with self._cond:
+                        self.timeouts += 1
+            except Exception:
+                # Error que no viene del servicio: ni se reintenta ni cuenta para el circuito
+                self._record(None)
+                raise
+            else:
+                self._record(success=True)
+                return result
+            finally:
+                self._release()
+
+            self._record(success=False)
+            if attempt >= self.retries:
+                if isinstance(error, self.timeout_errors):
+                    raise BackendTimeoutError(f"{self.name}: sin respuesta en {self.timeout} s") from error
+                raise error
+            attempt += 1
+            with self._cond:
+                self.retried += 1
+            # Espera exponencial con jitter completo: aleatoria entre 0 y base * 2^intento
+            time.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))))
+
+    def _can_start(self):
+        return self._in_flight < self.max_concurrency and self.breaker.try_acquire()
+
+    def _acquire(self):
+        # Esperar un hueco libre y que el circuito permita llamar
+        deadline = self._clock() + self.queue_timeout
+        with self._cond:
+            if self._can_start():
+                self._in_flight += 1
+                return
+            if self._waiting >= self.max_queue:
+                self.rejected += 1
+                raise BackendUnavailableError(f"{self.name}: cola llena")
+            self._waiting += 1
+            try:
+                while True:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0 or self.breaker.retry_after() > remaining:
+                        # Se agotó la espera o el circuito no se va a cerrar a tiempo: fallar ya
+                        self.rejected += 1
+                        state = self.breaker.state
+                        reason = f"sin hueco libre en {self.queue_timeout} s" if state == CLOSED \
+                            else f"circuito {state}"
+                        raise BackendUnavailableError(f"{self.name}: servicio no disponible ({reason})")
+                    wait = remaining
+                    if self.breaker.retry_after() > 0:
+                        wait = self.breaker.retry_after()
+                    self._cond.wait(wait)
+                    if self._can_start():
+                        self._in_flight += 1
+                        return
+            finally:
+                self._waiting -= 1
+
+    def _release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _record(self, success):
+        with self._cond:
+            self.calls += 1
+            if success is None:
+                self.breaker.cancel_probe()
+            elif success:
+                self.breaker.record_success()
+            else:
+                self.failures += 1
+                self.breaker.record_failure()
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "state": self.breaker.state,
+                "queue_depth": self._waiting,
+                "in_flight": self._in_flight,
+                "calls": self.calls,
+                "failures": self.failures,
+                "retries": self.retried,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,141 @@
+import wave
+from collections import namedtuple
+
+# Análisis de la velocidad del habla y de las pausas a partir del PCM:
+#   - el audio se procesa por bloques; cada bloque se divide en tramas de
+#     FRAME_MS y se calcula la energía RMS de cada trama con NumPy;
+#   - solo se guarda la energía de cada trama (4 bytes cada 20 ms, ~0.7 MB
+#     por hora de audio), así que la memoria no depende de la duración;
+#   - al final se separan las tramas con voz de las de silencio con un umbral
+#     adaptado al nivel de ruido de la grabación y se miden el silencio
+#     inicial y final y las pausas internas.
+# NumPy se importa al analizar, no al cargar el módulo.
+
+FRAME_MS = 20
+MIN_PAUSE_SECONDS = 0.25
+BLOCK_SECONDS = 10
+
+# Umbral de voz: entre el nivel de ruido (percentil 10) y el nivel de la voz
+# (percentil 95), nunca por debajo de -50 dBFS
+NOISE_PERCENTILE = 10
+SPEECH_PERCENTILE = 95
+THRESHOLD_RATIO = 0.2
+MIN_RMS = 10 ** (-50 / 20)
+
+SpeechAnalysis = namedtuple("SpeechAnalysis", ["duration", "voiced_seconds", "pause_count", "pause_seconds",
+                                               "leading_silence", "trailing_silence"])
+
+
+def speaking_seconds(analysis):
+    # Tiempo desde la primera hasta la última trama con voz (pausas incluidas)
+    return analysis.duration - analysis.leading_silence - analysis.trailing_silence
+
+
+class SpeechAnalyzer:
+    def __init__(self, sample_rate, sample_width, channels=1, frame_ms=FRAME_MS):
+        if sample_width not in (1, 2, 3, 4):
+            raise ValueError(f"Ancho de muestra no soportado: {sample_width}")
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.frame_size = max(1, int(sample_rate * frame_ms / 1000))
+        self._frame_bytes = self.frame_size * sample_width * channels
+        self._full_scale = float(2 ** (8 * sample_width - 1))
+        self._pending = b""
+        self._energies = []
+        self._num_bytes = 0
+
+    def feed(self, block):
+        # Añadir un bloque de PCM; los bytes que no completan una trama se
+        # guardan para el bloque siguiente
+        import numpy as np
+
+        block = bytes(block)
+        self._num_bytes += len(block)
+        if self._pending:
+            block = self._pending + block
+        usable = len(block) - len(block) % self._frame_bytes
+        self._pending = block[usable:]
+        if not usable:
+            return
+
+        samples = self._samples(np, block[:usable])
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels).mean(axis=1)
+        frames = samples.reshape(-1, self.frame_size)
+        # Suma de cuadrados por trama sin arrays intermedios
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / self.frame_size) / self._full_scale
+        self._energies.append(rms.astype(np.float32))
+
+    def _samples(self, np, data):
+        # Muestras como float32 (precisión de sobra para la energía), centradas en 0
+        if self.sample_width == 1:
+            return np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0
+        if self.sample_width == 3:
+            # 24 bits: ampliar a 32 bits con el byte menos significativo a 0
+            raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+            wide = np.zeros((len(raw), 4), dtype=np.uint8)
+            wide[:, 1:] = raw
+            return wide.view("<i4").ravel().astype(np.float32) / 256.0
+        dtype = "<i2" if self.sample_width == 2 else "<i4"
+        return np.frombuffer(data, dtype=dtype).astype(np.float32)
+
+    def finish(self, min_pause_seconds=MIN_PAUSE_SECONDS):
+        import numpy as np
+
+        num_samples = self._num_bytes // (self.sample_width * self.channels)
+        duration = num_samples / float(self.sample_rate) if self.sample_rate else 0.0
+        energies = np.concatenate(self._energies) if self._energies else np.zeros(0, dtype=np.float32)
+        frame_seconds = self.frame_size / float(self.sample_rate)
+
+        voiced = energies >= _voicing_threshold(np, energies)
+        if not voiced.any():
+            return SpeechAnalysis(duration, 0.0, 0, 0.0, duration, 0.0)
+
+        first = int(np.argmax(voiced))
+        last = len(voiced) - 1 - int(np.argmax(voiced[::-1]))
+        leading = first * frame_seconds
+        trailing = max(0.0, duration - (last + 1) * frame_seconds)
+
+        # Tramos de silencio entre la primera y la última trama con voz
+        inner = voiced[first:last + 1].astype(np.int8)
+        edges = np.diff(np.concatenate(([1], inner, [1])))
+        lengths = np.flatnonzero(edges == 1) - np.flatnonzero(edges == -1)
+        pauses = lengths[lengths * frame_seconds >= min_pause_seconds]
+
+        pause_seconds = float(pauses.sum()) * frame_seconds
+        voiced_seconds = (last + 1 - first) * frame_seconds - pause_seconds
+        return SpeechAnalysis(duration, voiced_seconds, int(len(pauses)), pause_seconds, leading, trailing)
+
+
+def _voicing_threshold(np, energies):
+    if not len(energies):
+        return MIN_RMS
+    noise, speech = np.percentile(energies, [NOISE_PERCENTILE, SPEECH_PERCENTILE])
+    if speech < 2 * noise:
+        # Sin contraste entre ruido y voz (todo voz o todo ruido): solo el umbral absoluto
+        return MIN_RMS
+    return max(MIN_RMS, noise + THRESHOLD_RATIO * (speech - noise))
+
+
+def analyze_audio_data(audio, min_pause_seconds=MIN_PAUSE_SECONDS, block_seconds=BLOCK_SECONDS):
+    # Analizar un AudioData ya decodificado, por bloques (sin copiar el audio entero)
+    analyzer = SpeechAnalyzer(audio.sample_rate, audio.sample_width)
+    data = memoryview(audio.frame_data)
+    block_bytes = max(1, int(block_seconds * audio.sample_rate)) * audio.sample_width
+    for start in range(0, len(data), block_bytes):
+        analyzer.feed(data[start:start + block_bytes])
+    return analyzer.finish(min_pause_seconds)
+
+
+def analyze_wav(filepath, min_pause_seconds=MIN_PAUSE_SECONDS, block_seconds=BLOCK_SECONDS):
+    # Analizar un WAV leyéndolo del disco por bloques (grabaciones de horas)
+    with wave.open(filepath, "rb") as wav:
+        analyzer = SpeechAnalyzer(wav.getframerate(), wav.getsampwidth(), wav.getnchannels())
+        block_frames = max(1, int(block_seconds * wav.getframerate()))
+        while True:
+            block = wav.readframes(block_frames)
+            if not block:
+                break
+            analyzer.feed(block)
+    return analyzer.finish(min_pause_seconds)
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Almacén de subidas direccionado por contenido:
+#   - las subidas HTTP se escriben en un temporal del almacén a medida que las
+#     lee el parser multipart (open_upload), calculando a la vez su SHA-256, y
+#     save() solo lo renombra; otros streams se copian por bloques;
+#   - cada archivo se guarda como <hash><extensión>, así que las subidas
+#     idénticas se deduplican y los nombres repetidos no se pisan;
+#   - el resultado del pipeline se guarda como <hash>.json para no volver a
+#     procesar un audio idéntico, y el estado del trabajo asíncrono que lo
+#     procesa como <hash>.job.json, visible para todos los workers;
+#   - los archivos antiguos se eliminan por edad o por tamaño total.
+
+CHUNK_SIZE = 64 * 1024
+RESULT_SUFFIX = ".json"
+JOB_SUFFIX = ".job.json"
+
+
+class UploadTooLargeError(Exception):
+    pass
+
+
+class StoredUpload:
+    # Temporal del almacén donde se escribe el archivo subido mientras llega;
+    # el resto de métodos (read, seek, tell...) son los del archivo
+    def __init__(self, store):
+        self.store = store
+        fd, self.path = tempfile.mkstemp(dir=store.folder, prefix=".upload-")
+        self._file = os.fdopen(fd, "w+b")
+        self.digest = hashlib.sha256()
+        self.saved = False
+
+    def write(self, data):
+        self.digest.update(data)
+        return self._file.write(data)
+
+    def finish(self):
+        # El almacén se queda con el archivo: cerrarlo sin borrarlo; devuelve (ruta, hash)
+        self.saved = True
+        self._file.close()
+        return self.path, self.digest.hexdigest()
+
+    def close(self):
+        # Al terminar la petición: si no se guardó (subida rechazada), se borra
+        self._file.close()
+        if not self.saved and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class UploadStore:
+    def __init__(self, folder, max_upload_bytes=50 * 1024 * 1024, max_age=7 * 24 * 3600,
+                 max_total_bytes=1024 * 1024 * 1024):
+        self.folder = folder
+        self.max_upload_bytes = max_upload_bytes
+        self.max_age = max_age
+        self.max_total_bytes = max_total_bytes
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    def open_upload(self):
+        # Destino del parser multipart para un archivo subido (ver AppRequest en app.py)
+        return StoredUpload(self)
+
+    def save(self, stream, extension):
+        # Guardar el archivo con su hash como nombre; devuelve (hash, ruta)
+        if isinstance(stream, StoredUpload) and stream.store is self:
+            # Ya está en el almacén y con el hash calculado: solo falta renombrarlo
+            tmp_path, content_hash = stream.finish()
+            return self._commit(tmp_path, content_hash, extension)
+
+        # Otro stream: copiarlo a un temporal calculando el hash
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if self.max_upload_bytes and size > self.max_upload_bytes:
+                        raise UploadTooLargeError("El archivo supera el tamaño máximo permitido")
+                    digest.update(chunk)
+                    tmp.write(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return self._commit(tmp_path, digest.hexdigest(), extension)
+
+    def _commit(self, tmp_path, content_hash, extension):
+        path = self.path_for(content_hash, extension)
+        try:
+            with self._lock:
+                if os.path.exists(path):
+                    # Subida idéntica: conservar el archivo existente y renovar su fecha
+                    os.remove(tmp_path)
+                    os.utime(path)
+                else:
+                    os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict(keep=content_hash)
+        return content_hash, path
+
+    def path_for(self, content_hash, extension):
+        return os.path.join(self.folder, content_hash + extension.lower())
+
+    def load_result(self, content_hash):
+        return self._load_json(content_hash + RESULT_SUFFIX)
+
+    def save_result(self, content_hash, result):
+        self._save_json(content_hash + RESULT_SUFFIX, result)
+
+    def load_job(self, content_hash):
+        return self._load_json(content_hash + JOB_SUFFIX)
+
+    def save_job(self, content_hash, state):
+        self._save_json(content_hash + JOB_SUFFIX, state)
+
+    def _load_json(self, name):
+        path = os.path.join(self.folder, name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def _save_json(self, name, data):
+        # Escribir en un temporal y renombrar: quien lee nunca ve un archivo a medias
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=".result-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(self.folder, name))
+
+    def evict(self, keep=None):
+        # Agrupar los archivos por hash (audio + resultado) y eliminar los grupos
+        # caducados y, si se supera el presupuesto, los de uso más antiguo
+        now = time.time()
+        groups = {}
+        with self._lock:
+            for entry in os.scandir(self.folder):
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+                content_hash = entry.name.split(".", 1)[0]
+                stat = entry.stat()
+                group = groups.setdefault(content_hash, {"paths": [], "size": 0, "mtime": 0.0})
+                group["paths"].append(entry.path)
+                group["size"] += stat.st_size
+                group["mtime"] = max(group["mtime"], stat.st_mtime)
+
+            total = sum(group["size"] for group in groups.values())
+            for group in sorted(groups.values(), key=lambda g: g["mtime"]):
+                expired = self.max_age and group["mtime"] < now - self.max_age
+                over_budget = self.max_total_bytes and total > self.max_total_bytes
+                if not (expired or over_budget) or group is groups.get(keep):
+                    continue
+                for path in group["paths"]:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= group["size"]
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+
+# Índice de sinónimos precompilado. Se construye una sola vez a partir del
+# diccionario de sinónimos y permite:
+#   - normalizar un texto en una sola pasada, sobre límites de palabra
+#     (trie de tokens, coincidencia más larga primero);
+#   - responder si dos palabras son sinónimas en O(1).
+# El diccionario vive en un archivo JSON (data/synonyms.json); load_synonym_index
+# guarda el índice ya construido con pickle, de modo que los workers que
+# arrancan después lo cargan sin volver a construirlo.
+
+# Cambiar si cambia la estructura de SynonymIndex, para invalidar los pickles antiguos
+_CACHE_VERSION = 1
+
+
+def clean_text(text):
+    # Eliminar signos de puntuación y convertir a minúsculas
+    text = re.sub(r'[^\w\s]', '', text)  # Eliminar todo excepto letras y espacios
+    text = text.lower()  # Convertir a minúsculas
+    return text
+
+
+# Marca de fin de frase dentro del trie (str.split nunca produce un token vacío;
+# una cadena, a diferencia de object(), sigue siendo la misma tras pickle)
+_END = ""
+
+
+class SynonymIndex:
+    def __init__(self, synonyms_dict):
+        # Posición de cada clave en el diccionario: la clave más antigua gana,
+        # igual que en el reemplazo secuencial original
+        key_order = {}
+        for key in synonyms_dict:
+            key_order.setdefault(clean_text(key), len(key_order))
+
+        # Para cada palabra/frase, las claves con las que está relacionada
+        related_keys = {}
+        self._pairs = set()
+        for key, synonyms in synonyms_dict.items():
+            key = clean_text(key)
+            related_keys.setdefault(key, set()).add(key)
+            for synonym in synonyms:
+                synonym = clean_text(synonym)
+                related_keys.setdefault(synonym, set()).add(key)
+                self._pairs.add((key, synonym))
+                self._pairs.add((synonym, key))
+
+        # Forma canónica: la primera clave del diccionario relacionada con la palabra
+        self._canonical = {
+            phrase: min(keys, key=key_order.__getitem__)
+            for phrase, keys in related_keys.items()
+        }
+
+        # Trie de tokens: cada nodo es un dict token -> nodo; _END guarda la forma canónica
+        self._trie = {}
+        for phrase, canonical in self._canonical.items():
+            tokens = phrase.split()
+            if not tokens or tokens == canonical.split():
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_END] = canonical
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def canonical(self, word):
+        # Forma canónica de una palabra (la propia palabra si no tiene sinónimos)
+        return self._canonical.get(word, word)
+
+    def normalize(self, text):
+        # Reemplazar sinónimos en una sola pasada sobre los tokens del texto
+        tokens = text.split()
+        result = []
+        i = 0
+        n = len(tokens)
+        while i < n:
+            node = self._trie
+            match = None
+            match_end = i
+            j = i
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match = node[_END]
+                    match_end = j
+            if match is None:
+                result.append(tokens[i])
+                i += 1
+            else:
+                result.append(match)
+                i = match_end
+        return " ".join(result)
+
+    def are_synonyms(self, word1, word2):
+        # Comprobar si las palabras son sinónimos
+        if word1 == word2 or (word1, word2) in self._pairs:
+            return True
+        return self.canonical(word1) == self.canonical(word2)
+
+
+def load_synonym_index(path, cache_path=None):
+    # Cargar el índice desde el JSON de sinónimos. Con cache_path, se reutiliza
+    # el índice guardado si se construyó a partir del mismo contenido del JSON
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if cache_path:
+        try:
+            with open(cache_path, "rb") as f:
+                version, cached_digest, index = pickle.load(f)
+            if version == _CACHE_VERSION and cached_digest == digest:
+                return index
+        except Exception:
+            pass  # Caché ausente, antigua o corrupta: se reconstruye
+
+    index = SynonymIndex(json.loads(raw.decode("utf-8")))
+
+    if cache_path:
+        # Escritura atómica: otro worker nunca lee un pickle a medias
+        directory = os.path.dirname(os.path.abspath(cache_path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".synonyms-")
+        except OSError:
+            return index  # Sin permisos de escritura: se usa el índice sin guardarlo
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((_CACHE_VERSION, digest, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return index
@@ -0,0 +1,134 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# Transcripción por fragmentos para grabaciones largas:
+#   - el audio se divide en fragmentos cortando en el silencio más cercano
+#     (modo "silence") o en ventanas fijas con solapamiento (modo "fixed");
+#   - los fragmentos se transcriben en paralelo con un pool de hilos acotado;
+#   - los textos se unen en orden, eliminando las palabras repetidas por el
+#     solapamiento.
+# El reconocedor es cualquier función recognize(audio_data) -> texto que lance
+# las excepciones de speech_recognition, así que se puede sustituir por uno local.
+# transcribe_chunked devuelve (texto, fragmentos fallidos): si algún fragmento
+# falló por un error del servicio, el texto está incompleto.
+# speech_recognition se importa al usarse, no al cargar el módulo.
+
+FRAME_MS = 50
+_ARRAY_TYPES = {1: "b", 2: "h", 4: "i"}
+
+
+def _segment(audio, start_ms, end_ms):
+    # Igual que AudioData.get_segment, pero cortando siempre en un límite de muestra
+    import speech_recognition as sr
+
+    width = audio.sample_width
+    start_byte = int(start_ms * audio.sample_rate / 1000) * width
+    end_byte = int(end_ms * audio.sample_rate / 1000) * width
+    return sr.AudioData(audio.frame_data[start_byte:end_byte], audio.sample_rate, width)
+
+
+def _frame_energy(audio, start_ms, end_ms):
+    # Energía media (valor absoluto medio) de un tramo de audio
+    segment = _segment(audio, start_ms, end_ms)
+    typecode = _ARRAY_TYPES.get(segment.sample_width)
+    if typecode is None or not segment.frame_data:
+        return 0.0
+    samples = array(typecode)
+    samples.frombytes(segment.frame_data)
+    if not samples:
+        return 0.0
+    return sum(map(abs, samples)) / len(samples)
+
+
+def _quietest_point(audio, start_ms, end_ms):
+    # Centro del tramo de FRAME_MS con menos energía dentro de [start_ms, end_ms)
+    best_ms = end_ms
+    best_energy = None
+    for frame_start in range(int(start_ms), int(end_ms) - FRAME_MS + 1, FRAME_MS):
+        energy = _frame_energy(audio, frame_start, frame_start + FRAME_MS)
+        if best_energy is None or energy < best_energy:
+            best_energy = energy
+            best_ms = frame_start + FRAME_MS // 2
+    return best_ms
+
+
+def split_audio(audio, chunk_seconds=30, overlap_seconds=0.0, mode="silence", search_seconds=5.0):
+    # Devuelve una lista de (inicio_ms, fin_ms) que cubre todo el audio
+    total_ms = len(audio.frame_data) * 1000.0 / (audio.sample_rate * audio.sample_width)
+    chunk_ms = chunk_seconds * 1000.0
+    if total_ms <= chunk_ms:
+        return [(0, total_ms)]
+
+    boundaries = []
+    start = 0.0
+    if mode == "fixed":
+        step = chunk_ms - overlap_seconds * 1000.0
+        if step <= 0:
+            raise ValueError("El solapamiento debe ser menor que el tamaño del fragmento")
+        while start < total_ms:
+            end = min(start + chunk_ms, total_ms)
+            boundaries.append((start, end))
+            if end >= total_ms:
+                break
+            start += step
+    elif mode == "silence":
+        search_ms = min(search_seconds * 1000.0, chunk_ms / 2)
+        while total_ms - start > chunk_ms:
+            target = start + chunk_ms
+            cut = _quietest_point(audio, target - search_ms, target)
+            boundaries.append((start, cut))
+            start = cut
+        boundaries.append((start, total_ms))
+    else:
+        raise ValueError(f"Modo de fragmentación desconocido: {mode}")
+    return boundaries
+
+
+def stitch(texts, max_overlap_words=20):
+    # Unir los textos en orden quitando el prefijo de cada uno que repite el final del anterior
+    words = []
+    for text in texts:
+        next_words = text.split()
+        overlap = 0
+        for size in range(min(max_overlap_words, len(words), len(next_words)), 0, -1):
+            if [w.lower() for w in words[-size:]] == [w.lower() for w in next_words[:size]]:
+                overlap = size
+                break
+        words.extend(next_words[overlap:])
+    return " ".join(words)
+
+
+def transcribe_chunked(audio, recognize, chunk_seconds=30, overlap_seconds=0.0, mode="silence",
+                       max_workers=4, retries=1):
+    import speech_recognition as sr
+
+    boundaries = split_audio(audio, chunk_seconds, overlap_seconds, mode)
+    chunks = [_segment(audio, start, end) for start, end in boundaries]
+
+    def transcribe_chunk(chunk):
+        # Devuelve (texto, error); un fragmento sin voz no es un error
+        for attempt in range(retries + 1):
+            try:
+                return recognize(chunk), None
+            except sr.UnknownValueError as e:
+                return "", e
+            except sr.RequestError as e:
+                error = e
+        return None, error
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        results = list(executor.map(transcribe_chunk, chunks))
+
+    texts = [text for text, _ in results if text]
+    if not texts:
+        # Ningún fragmento produjo texto: propagar el error más grave
+        errors = [error for _, error in results if error is not None]
+        request_errors = [e for e in errors if isinstance(e, sr.RequestError)]
+        if request_errors:
+            raise request_errors[0]
+        raise sr.UnknownValueError()
+
+    # Los fragmentos que fallaron se omiten: se conserva el resto de la
+    # transcripción y se informa de cuántos faltan
+    failed = sum(1 for text, _ in results if text is None)
+    return stitch(texts, max_overlap_words=20 if overlap_seconds else 0), failed
@@ -0,0 +1,210 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Traducciones con caché y cliente reutilizable:
+#   - TranslationCache: LRU en memoria + SQLite en disco (con límite de
+#     tamaño y caducidad), con clave (hash del texto, src, dest);
+#   - TranslatorPool: pool de clientes de traducción de larga duración en lugar
+#     de crear un Translator() por petición;
+#   - CachedTranslator: combina ambos y cuenta aciertos y fallos.
+
+
+def cache_key(text, src, dest):
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{digest}:{src}:{dest}"
+
+
+class TranslationCache:
+    def __init__(self, path=None, max_memory_entries=1024, max_disk_entries=50000, ttl=30 * 24 * 3600):
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts_since_trim = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " key TEXT PRIMARY KEY, translated TEXT NOT NULL,"
+                " created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed)")
+            self._db.commit()
+
+    def get(self, text, src, dest):
+        key = cache_key(text, src, dest)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+            translated = self._disk_get(key)
+            if translated is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._memory_put(key, translated)
+            return translated
+
+    def put(self, text, src, dest, translated):
+        key = cache_key(text, src, dest)
+        with self._lock:
+            self._memory_put(key, translated)
+            self._disk_put(key, translated)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": self._disk_count(),
+            }
+
+    def _memory_put(self, key, translated):
+        self._memory[key] = translated
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT translated, created FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            translated, created = row
+            now = time.time()
+            if created < now - self.ttl:
+                self._db.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE translations SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            return translated
+        except sqlite3.Error:
+            # Un fallo de la caché en disco no debe impedir la traducción
+            return None
+
+    def _disk_put(self, key, translated):
+        if self._db is None:
+            return
+        now = time.time()
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations (key, translated, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, translated, now, now),
+            )
+            # Recortar la tabla de vez en cuando, no en cada escritura
+            self._puts_since_trim += 1
+            if self._puts_since_trim >= 100:
+                self._puts_since_trim = 0
+                self._trim(now)
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _trim(self, now):
+        # Eliminar entradas caducadas y, si sobran, las de acceso más antiguo
+        self._db.execute("DELETE FROM translations WHERE created < ?", (now - self.ttl,))
+        self._db.execute(
+            "DELETE FROM translations WHERE key IN ("
+            " SELECT key FROM translations ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+    def _disk_count(self):
+        if self._db is None:
+            return 0
+        try:
+            return self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+
+class TranslatorPool:
+    def __init__(self, factory, size=4):
+        self.factory = factory
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def client(self):
+        # Reutilizar un cliente libre; crear uno nuevo solo si no se ha llegado al límite
+        try:
+            translator = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if not create:
+                translator = self._idle.get()
+            else:
+                try:
+                    translator = self.factory()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+        try:
+            yield translator
+        finally:
+            self._idle.put(translator)
+
+
+class CachedTranslator:
+    def __init__(self, pool, cache, backend=None):
+        self.pool = pool
+        self.cache = cache
+        # resilience.Backend opcional: límite de concurrencia, tiempo máximo,
+        # reintentos y circuit breaker alrededor de la llamada real
+        self.backend = backend
+        self.external_calls = 0
+        self._lock = threading.Lock()
+
+    def translate(self, text, src, dest):
+        translated = self.cache.get(text, src, dest)
+        if translated is not None:
+            return translated
+
+        if self.backend is None:
+            translated = self._call_external(text, src, dest)
+        else:
+            translated = self.backend.call(self._call_external, text, src, dest)
+
+        self.cache.put(text, src, dest, translated)
+        return translated
+
+    def _call_external(self, text, src, dest):
+        with self.pool.client() as translator:
+            translated = translator.translate(text, src=src, dest=dest).text
+        with self._lock:
+            self.external_calls += 1
+        return translated
+
+    def stats(self):
+        stats = self.cache.stats()
+        stats["external_calls"] = self.external_calls
+        return stats